@@ -7,9 +7,58 @@
 이 스크립트는 수집된 멤버 캐릭터 정보를 분석하고 요약합니다.
 """
 
+import math
 import yaml
-from typing import Dict, List, Any
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 import os
+from pathlib import Path
+
+# libyaml 기반 C 로더가 있으면 사용하고, 없으면 순수 파이썬 로더로 대체
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# 레벨대별 분포 구간의 하한 경계값과 이름 (1600 미만은 집계하지 않음)
+LEVEL_RANGE_EDGES = (1600, 1620, 1640, 1660, 1680, 1700)
+LEVEL_RANGE_NAMES = ("1600~1620", "1620~1640", "1640~1660", "1660~1680", "1680~1700", "1700 이상")
+
+# 로드 시점에 미리 변환한 아이템 레벨(float)을 저장하는 키
+ITEM_LEVEL_KEY = "_item_level"
+
+def parse_item_level(item_level: Any) -> float:
+    """
+    ItemMaxLevel 값을 숫자로 변환합니다.
+    
+    Args:
+        item_level: ItemMaxLevel 값 (예: "1,620.00")
+        
+    Returns:
+        아이템 레벨. 변환할 수 없으면 NaN
+    """
+    try:
+        if isinstance(item_level, str):
+            # 쉼표 제거하고 숫자로 변환
+            return float(item_level.replace(',', ''))
+        return float(item_level)
+    except (ValueError, TypeError):
+        return math.nan
+
+def count_level_ranges(sorted_levels: Sequence[float]) -> List[int]:
+    """
+    정렬된 아이템 레벨 목록에서 레벨대별 캐릭터 수를 계산합니다.
+    
+    각 구간 경계를 이진 탐색하므로 캐릭터 수와 무관하게 구간 수만큼만 탐색합니다.
+    
+    Args:
+        sorted_levels: 오름차순으로 정렬된 아이템 레벨 목록
+        
+    Returns:
+        LEVEL_RANGE_NAMES 순서의 레벨대별 캐릭터 수
+    """
+    boundaries = [bisect_left(sorted_levels, edge) for edge in LEVEL_RANGE_EDGES]
+    boundaries.append(len(sorted_levels))
+    return [end - start for start, end in zip(boundaries, boundaries[1:])]
 
 def load_data(file_path: str = "data/members_character_info.yaml") -> Dict[str, List[Dict[str, Any]]]:
     """
@@ -19,121 +68,126 @@ def load_data(file_path: str = "data/members_character_info.yaml") -> Dict[str,
         file_path: 데이터 파일 경로
         
     Returns:
-        멤버 캐릭터 정보
+        멤버 캐릭터 정보 (각 캐릭터에 변환된 아이템 레벨이 ITEM_LEVEL_KEY로 추가됨)
     """
-    with open(file_path, 'r', encoding='utf-8') as file:
-        return yaml.safe_load(file) or {}
+    # 파일 객체 대신 단일 바이트 버퍼를 파서에 전달
+    data = yaml.load(Path(file_path).read_bytes(), Loader=YAML_LOADER) or {}
+    
+    # 아이템 레벨 문자열은 로드 시 한 번만 변환
+    for characters in data.values():
+        for char in characters:
+            char[ITEM_LEVEL_KEY] = parse_item_level(char.get('ItemMaxLevel', '0'))
+    
+    return data
 
-def analyze_member_data(data: Dict[str, List[Dict[str, Any]]]) -> None:
+def analyze_member_data(data: Dict[str, List[Dict[str, Any]]]) -> str:
     """
-    멤버 캐릭터 정보를 분석하고 출력합니다.
+    멤버 캐릭터 정보를 분석합니다.
     
     Args:
         data: 멤버 캐릭터 정보
+        
+    Returns:
+        분석 보고서 문자열
     """
-    print(f"\n{'=' * 50}")
-    print(f"멤버 캐릭터 정보 분석")
-    print(f"{'=' * 50}")
+    # 보고서 줄을 모아 두었다가 하나의 문자열로 반환
+    report: List[str] = []
+    
+    report.append(f"\n{'=' * 50}")
+    report.append(f"멤버 캐릭터 정보 분석")
+    report.append(f"{'=' * 50}")
     
     total_members = len(data)
-    total_characters = sum(len(chars) for chars in data.values())
+    char_counts = {member_id: len(characters) for member_id, characters in data.items()}
+    total_characters = sum(char_counts.values())
     
-    print(f"\n총 {total_members}명의 멤버, {total_characters}개의 캐릭터 정보가 있습니다.\n")
+    report.append(f"\n총 {total_members}명의 멤버, {total_characters}개의 캐릭터 정보가 있습니다.\n")
     
-    # 서버별 캐릭터 분포
-    server_distribution = {}
+    # 서버/클래스 이름, 아이템 레벨, 멤버별 최고 레벨 캐릭터를 한 번의 순회로 수집
+    # (분포는 순회 후 이름 목록으로 Counter를 만들어 집계)
+    server_names: List[str] = []
+    class_names: List[str] = []
+    all_levels = array('d')  # 연속된 float64 버퍼
+    # 멤버별 최고 레벨 캐릭터 (레벨 파싱에 실패한 캐릭터가 있으면 None)
+    highest_by_member: Dict[str, Optional[Tuple[float, Dict[str, Any]]]] = {}
     for member_id, characters in data.items():
+        highest: Optional[Tuple[float, Dict[str, Any]]] = None
+        level_parsed = True
         for char in characters:
-            server_name = char.get('ServerName', '알 수 없음')
-            server_distribution[server_name] = server_distribution.get(server_name, 0) + 1
+            server_names.append(char.get('ServerName', '알 수 없음'))
+            class_names.append(char.get('CharacterClassName', '알 수 없음'))
+            
+            item_level = char.get(ITEM_LEVEL_KEY)
+            if item_level is None:
+                item_level = parse_item_level(char.get('ItemMaxLevel', '0'))
+            if math.isnan(item_level):
+                level_parsed = False
+                continue
+            
+            all_levels.append(item_level)
+            if highest is None or item_level > highest[0]:
+                highest = (item_level, char)
+        
+        highest_by_member[member_id] = highest if level_parsed else None
     
-    print(f"\n서버별 캐릭터 분포:")
-    for server, count in sorted(server_distribution.items(), key=lambda x: x[1], reverse=True):
-        print(f"  {server}: {count}캐릭터 ({count/total_characters*100:.1f}%)")
+    # 목록 전체를 한 번에 넘기면 Counter가 C로 구현된 집계 루프를 사용
+    server_distribution = Counter(server_names)
+    class_distribution = Counter(class_names)
     
-    # 클래스별 캐릭터 분포
-    class_distribution = {}
-    for member_id, characters in data.items():
-        for char in characters:
-            class_name = char.get('CharacterClassName', '알 수 없음')
-            class_distribution[class_name] = class_distribution.get(class_name, 0) + 1
+    # 서버별 캐릭터 분포
+    report.append(f"\n서버별 캐릭터 분포:")
+    for server, count in server_distribution.most_common():
+        report.append(f"  {server}: {count}캐릭터 ({count/total_characters*100:.1f}%)")
     
-    print(f"\n클래스별 캐릭터 분포:")
-    for class_name, count in sorted(class_distribution.items(), key=lambda x: x[1], reverse=True):
-        print(f"  {class_name}: {count}캐릭터 ({count/total_characters*100:.1f}%)")
+    # 클래스별 캐릭터 분포
+    report.append(f"\n클래스별 캐릭터 분포:")
+    for class_name, count in class_distribution.most_common():
+        report.append(f"  {class_name}: {count}캐릭터 ({count/total_characters*100:.1f}%)")
     
     # 아이템 레벨 통계
-    all_levels = []
-    for member_id, characters in data.items():
-        for char in characters:
-            item_level_str = char.get('ItemMaxLevel', '0')
-            try:
-                # 쉼표 제거하고 숫자로 변환
-                item_level = float(item_level_str.replace(',', ''))
-                all_levels.append(item_level)
-            except (ValueError, TypeError):
-                continue
-    
     if all_levels:
+        # 한 번 정렬해 두고 최저/최고 레벨과 레벨대별 분포 계산에 재사용
+        sorted_levels = sorted(all_levels)
         average_level = sum(all_levels) / len(all_levels)
-        max_level = max(all_levels)
-        min_level = min(all_levels)
+        max_level = sorted_levels[-1]
+        min_level = sorted_levels[0]
         
-        print(f"\n아이템 레벨 통계:")
-        print(f"  평균 레벨: {average_level:.2f}")
-        print(f"  최고 레벨: {max_level:.2f}")
-        print(f"  최저 레벨: {min_level:.2f}")
+        report.append(f"\n아이템 레벨 통계:")
+        report.append(f"  평균 레벨: {average_level:.2f}")
+        report.append(f"  최고 레벨: {max_level:.2f}")
+        report.append(f"  최저 레벨: {min_level:.2f}")
         
         # 레벨대별 분포
-        level_ranges = {
-            "1600~1620": 0,
-            "1620~1640": 0,
-            "1640~1660": 0,
-            "1660~1680": 0,
-            "1680~1700": 0,
-            "1700 이상": 0
-        }
-        
-        for level in all_levels:
-            if 1600 <= level < 1620:
-                level_ranges["1600~1620"] += 1
-            elif 1620 <= level < 1640:
-                level_ranges["1620~1640"] += 1
-            elif 1640 <= level < 1660:
-                level_ranges["1640~1660"] += 1
-            elif 1660 <= level < 1680:
-                level_ranges["1660~1680"] += 1
-            elif 1680 <= level < 1700:
-                level_ranges["1680~1700"] += 1
-            elif level >= 1700:
-                level_ranges["1700 이상"] += 1
+        level_ranges = dict(zip(LEVEL_RANGE_NAMES, count_level_ranges(sorted_levels)))
         
-        print(f"\n레벨대별 캐릭터 분포:")
+        report.append(f"\n레벨대별 캐릭터 분포:")
         for range_name, count in level_ranges.items():
-            print(f"  {range_name}: {count}캐릭터 ({count/len(all_levels)*100:.1f}%)")
+            report.append(f"  {range_name}: {count}캐릭터 ({count/len(all_levels)*100:.1f}%)")
     
     # 멤버별 캐릭터 수 및 최고 레벨
-    print(f"\n멤버별 캐릭터 정보:")
-    for member_id, characters in sorted(data.items(), key=lambda x: len(x[1]), reverse=True):
-        char_count = len(characters)
+    report.append(f"\n멤버별 캐릭터 정보:")
+    # 내장 메서드를 정렬 키로 사용 (동률은 기존 순서 유지)
+    for member_id in sorted(char_counts, key=char_counts.__getitem__, reverse=True):
+        char_count = char_counts[member_id]
         if char_count == 0:
             continue
         
-        # 최고 레벨 캐릭터 찾기
-        try:
-            highest_char = max(
-                characters,
-                key=lambda x: float(x.get('ItemMaxLevel', '0').replace(',', ''))
-            )
-            highest_level = highest_char.get('ItemMaxLevel', '0')
-            highest_name = highest_char.get('CharacterName', '알 수 없음')
-            highest_class = highest_char.get('CharacterClassName', '알 수 없음')
-            
-            print(f"  {member_id}: {char_count}캐릭터, 최고 레벨: {highest_name}({highest_class}) - {highest_level}")
-        except (ValueError, TypeError):
-            print(f"  {member_id}: {char_count}캐릭터, 레벨 정보 없음")
+        # 최고 레벨 캐릭터 (집계 단계에서 계산된 값 사용)
+        highest = highest_by_member.get(member_id)
+        if highest is None:
+            report.append(f"  {member_id}: {char_count}캐릭터, 레벨 정보 없음")
+            continue
+        
+        highest_char = highest[1]
+        highest_level = highest_char.get('ItemMaxLevel', '0')
+        highest_name = highest_char.get('CharacterName', '알 수 없음')
+        highest_class = highest_char.get('CharacterClassName', '알 수 없음')
+        
+        report.append(f"  {member_id}: {char_count}캐릭터, 최고 레벨: {highest_name}({highest_class}) - {highest_level}")
+    
+    report.append(f"\n{'=' * 50}\n")
     
-    print(f"\n{'=' * 50}\n")
+    return "\n".join(report)
 
 def main() -> None:
     """
@@ -144,7 +198,8 @@ def main() -> None:
         return
     
     data = load_data()
-    analyze_member_data(data)
+    # 보고서 전체를 한 번에 출력
+    print(analyze_member_data(data))
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
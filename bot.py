@@ -10,21 +10,22 @@ Discord 봇의 메인 모듈.
 import asyncio
 import logging
 import os
-import threading
 from typing import Any, Dict, List, Optional, Union
-from http.server import HTTPServer, BaseHTTPRequestHandler
 
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
+# Raids Cog의 on_message에서 처리하는 레이드 관리용 명령어 접두사
+from utils.discord_utils import RAID_COMMAND_PREFIXES
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler("bot.log", encoding="utf-8"),
+        logging.FileHandler("bot.log", encoding="utf-8", delay=True),
     ],
 )
 logger = logging.getLogger("discord_bot")
@@ -43,31 +44,49 @@ intents.members = True
 # 봇 인스턴스 생성
 bot = commands.Bot(command_prefix=PREFIX, intents=intents)
 
-# 상태 확인용 HTTP 서버 핸들러
-class HealthCheckHandler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        """상태 확인 요청에 대한 응답을 처리합니다."""
-        self.send_response(200)
-        self.send_header('Content-type', 'text/plain')
-        self.end_headers()
-        self.wfile.write(b'Bot is running')
-        
-    def log_message(self, format, *args):
-        """HTTP 서버 로그 메시지를 Discord 봇 로거로 리다이렉트합니다."""
-        logger.info(f"Health check: {format % args}")
+# 상태 확인 요청에 돌려줄 고정 HTTP 응답
+HEALTH_CHECK_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/plain\r\n"
+    b"Content-Length: 14\r\n"
+    b"Connection: close\r\n"
+    b"\r\n"
+    b"Bot is running"
+)
+
+# 요청 헤더를 기다리는 최대 시간 (초). 헤더를 보내지 않는 연결이 계속 열려 있지 않도록 함
+HEALTH_CHECK_READ_TIMEOUT = 5
 
-def start_http_server():
-    """상태 확인을 위한 HTTP 서버를 시작합니다."""
-    server = HTTPServer(('0.0.0.0', PORT), HealthCheckHandler)
-    logger.info(f"상태 확인 서버가 포트 {PORT}에서 시작되었습니다.")
-    server.serve_forever()
 
-# 별도의 스레드에서 HTTP 서버 시작
-def run_http_server():
-    """별도의 스레드에서 HTTP 서버를 실행합니다."""
-    http_thread = threading.Thread(target=start_http_server, daemon=True)
-    http_thread.start()
-    logger.info("상태 확인 HTTP 서버 스레드가 시작되었습니다.")
+async def handle_health_check(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """
+    상태 확인 요청에 고정된 응답을 보내고 연결을 닫습니다.
+    
+    Args:
+        reader: 클라이언트 스트림 리더
+        writer: 클라이언트 스트림 라이터
+    """
+    try:
+        # 요청 헤더 끝까지만 읽고 내용은 해석하지 않음
+        await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=HEALTH_CHECK_READ_TIMEOUT)
+        writer.write(HEALTH_CHECK_RESPONSE)
+        await writer.drain()
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_health_check_server() -> asyncio.AbstractServer:
+    """
+    봇과 같은 이벤트 루프에서 상태 확인 서버를 시작합니다.
+    
+    Returns:
+        실행 중인 서버 객체
+    """
+    server = await asyncio.start_server(handle_health_check, "0.0.0.0", PORT)
+    logger.info(f"상태 확인 서버가 포트 {PORT}에서 시작되었습니다.")
+    return server
 
 
 @bot.event
@@ -103,11 +122,8 @@ async def on_command_error(ctx: commands.Context, error: commands.CommandError)
     # 레이드 관리용 특수 명령어인 경우 오류 메시지를 표시하지 않음
     if isinstance(error, commands.CommandNotFound):
         command_text = ctx.message.content.strip()
-        raid_commands = ["!추가", "!제거", "!수정"]
-        
-        for cmd in raid_commands:
-            if command_text.startswith(cmd):
-                return  # 레이드 명령어는 오류 메시지 표시하지 않고 종료
+        if command_text.startswith(RAID_COMMAND_PREFIXES):
+            return  # 레이드 명령어는 오류 메시지 표시하지 않고 종료
     
     # 일반적인 오류 처리
     if isinstance(error, commands.CommandNotFound):
@@ -140,13 +156,22 @@ async def load_extensions() -> None:
     """
     # cogs 디렉토리가 존재하면 모든 확장 모듈을 로드
     if os.path.exists("cogs"):
-        for filename in os.listdir("cogs"):
-            if filename.endswith(".py") and not filename.startswith("_"):
-                try:
-                    await bot.load_extension(f"cogs.{filename[:-3]}")
-                    logger.info(f"확장 모듈 로드 성공: cogs.{filename[:-3]}")
-                except Exception as e:
-                    logger.error(f"확장 모듈 로드 실패: cogs.{filename[:-3]} - {e}")
+        extensions = [
+            f"cogs.{filename[:-3]}"
+            for filename in os.listdir("cogs")
+            if filename.endswith(".py") and not filename.startswith("_")
+        ]
+        
+        # 확장 모듈을 동시에 로드하고 결과는 모듈별로 로깅
+        results = await asyncio.gather(
+            *(bot.load_extension(extension) for extension in extensions),
+            return_exceptions=True,
+        )
+        for extension, result in zip(extensions, results):
+            if isinstance(result, Exception):
+                logger.error(f"확장 모듈 로드 실패: {extension} - {result}")
+            else:
+                logger.info(f"확장 모듈 로드 성공: {extension}")
 
 
 async def main() -> None:
@@ -155,10 +180,10 @@ async def main() -> None:
     
     확장 모듈을 로드하고 봇을 시작합니다.
     """
-    # 상태 확인 HTTP 서버 시작
-    run_http_server()
+    # 상태 확인 서버 시작 (별도 스레드 없이 같은 이벤트 루프에서 처리)
+    health_server = await start_health_check_server()
     
-    async with bot:
+    async with health_server, bot:
         await load_extensions()
         logger.info("봇 시작 중...")
         if not TOKEN:
@@ -8,20 +8,47 @@
 """
 
 import asyncio
+import functools
 import logging
 import os
-from typing import Dict, List, Optional, Union, Any, cast, Tuple, Callable
+import re
+from collections import deque
+from typing import AsyncIterator, Dict, FrozenSet, List, Optional, Set, Union, Any, Tuple
 
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
+from utils.discord_utils import delete_threads, purge_channel_messages
+
 # 로깅 설정
 logger = logging.getLogger("channel_messages")
 
-# 환경 변수 로드
-load_dotenv(".env.secret")
-AUTHORIZED_USERS = os.getenv("AUTHORIZED_USERS", "").split(",")
+# 채널별로 메모리에 보관할 최근 메시지 수 (메시지 검색 범위 최대값과 동일)
+MESSAGE_CACHE_SIZE = 500
+# 메시지 검색 시 동시에 검색할 채널 수와 최대 결과 수
+SEARCH_CONCURRENCY = 5
+MAX_SEARCH_RESULTS = 20
+# 메시지 검색 진행 상황 메시지를 수정하는 간격 (초)
+SEARCH_PROGRESS_INTERVAL = 3
+
+
+@functools.cache
+def get_authorized_users() -> FrozenSet[int]:
+    """
+    권한 있는 사용자 Discord ID 집합을 처음 사용할 때 한 번만 만듭니다.
+    
+    환경 변수에 AUTHORIZED_USERS가 없을 때만 .env.secret 파일을 읽습니다.
+    
+    Returns:
+        권한 있는 사용자 ID 집합 (숫자가 아닌 항목과 빈 항목은 무시)
+    """
+    if "AUTHORIZED_USERS" not in os.environ:
+        load_dotenv(".env.secret")
+    
+    return frozenset(
+        int(uid) for uid in os.getenv("AUTHORIZED_USERS", "").split(",") if uid.strip().isdigit()
+    )
 
 
 class ChannelMessages(commands.Cog):
@@ -39,6 +66,10 @@ class ChannelMessages(commands.Cog):
             bot: 봇 인스턴스
         """
         self.bot = bot
+        # 서버 텍스트 채널/스레드 ID별 최근 메시지 캐시 (게이트웨이 연결 이후 수신한 메시지만 시간순으로 보관)
+        self.message_cache: Dict[int, deque] = {}
+        # 도움말 임베드 캐시 (처음 요청될 때 생성)
+        self._help_embed: Optional[discord.Embed] = None
     
     # ============= 동기 헬퍼 함수 =============
     
@@ -52,11 +83,11 @@ class ChannelMessages(commands.Cog):
         Returns:
             권한 여부
         """
-        # Discord ID를 문자열로 변환
-        user_id_str = str(user_id)
-        
-        # 권한 있는 사용자 ID 목록 확인
-        return not AUTHORIZED_USERS or user_id_str in AUTHORIZED_USERS
+        # 권한 있는 사용자 ID 집합 확인 (Discord ID는 정수로 비교)
+        try:
+            return int(user_id) in get_authorized_users()
+        except (ValueError, TypeError):
+            return False
     
     def get_channel_by_id(self, channel_id: Union[str, int]) -> Optional[Any]:
         """
@@ -118,6 +149,48 @@ class ChannelMessages(commands.Cog):
         """
         return self.bot.user is not None and message.author.id == self.bot.user.id
     
+    def parse_message_reference(self, message_ref: Union[str, int]) -> Tuple[Optional[Any], int]:
+        """
+        메시지 ID 또는 '채널ID-메시지ID' 형식의 문자열을 해석하는 동기 함수.
+        
+        Args:
+            message_ref: 메시지 ID 또는 '채널ID-메시지ID'
+            
+        Returns:
+            (지정된 채널 또는 None, 메시지 ID)
+            
+        Raises:
+            ValueError: ID가 숫자가 아니거나 지정된 채널을 찾을 수 없는 경우
+        """
+        channel = None
+        if isinstance(message_ref, str) and "-" in message_ref:
+            channel_part, message_ref = message_ref.split("-", 1)
+            channel = self.get_channel_by_id(channel_part)
+            if channel is None:
+                raise ValueError(f"채널을 찾을 수 없습니다: {channel_part}")
+        
+        return channel, int(message_ref)
+    
+    def get_partial_message(self, message_ref: str) -> Optional[discord.PartialMessage]:
+        """
+        '채널ID-메시지ID' 형식이면 조회 없이 사용할 수 있는 PartialMessage를 만드는 동기 함수.
+        
+        Args:
+            message_ref: 메시지 ID 또는 '채널ID-메시지ID'
+            
+        Returns:
+            PartialMessage 객체. 채널이 지정되지 않았거나 찾을 수 없으면 None
+        """
+        try:
+            channel, message_id_int = self.parse_message_reference(message_ref)
+        except (ValueError, TypeError):
+            return None
+        
+        if channel is None or not hasattr(channel, 'get_partial_message'):
+            return None
+        
+        return channel.get_partial_message(message_id_int)
+    
     def format_messages_content(self, messages: List[discord.Message]) -> List[str]:
         """
         메시지 목록을 표시 형식으로 변환하는 동기 함수.
@@ -143,17 +216,23 @@ class ChannelMessages(commands.Cog):
             청크 목록
         """
         chunks = []
-        current_chunk = header
+        # 문자열을 이어 붙이지 않고 조각을 모았다가 청크 단위로 join
+        current_parts = [header]
+        current_size = len(header)
         
         for message in messages:
-            if len(current_chunk) + len(message) + 2 > chunk_size:
-                chunks.append(current_chunk)
-                current_chunk = header
-            
-            current_chunk += message + "\n\n"
+            message_size = len(message) + 2
+            if current_size + message_size > chunk_size:
+                chunks.append("".join(current_parts))
+                current_parts = [header]
+                current_size = len(header)
+            
+            current_parts.append(message)
+            current_parts.append("\n\n")
+            current_size += message_size
         
-        if current_chunk != header:
-            chunks.append(current_chunk)
+        if len(current_parts) > 1:
+            chunks.append("".join(current_parts))
             
         return chunks
     
@@ -177,9 +256,8 @@ class ChannelMessages(commands.Cog):
         )
         
         # 최대 지정된 개수까지만 표시
-        count = 0
-        for item in found_messages[:max_results]:
-            count += 1
+        add_field = result_embed.add_field
+        for count, item in enumerate(found_messages[:max_results], 1):
             message = item['message']
             channel = item['channel']
             
@@ -192,7 +270,7 @@ class ChannelMessages(commands.Cog):
             timestamp = message.created_at.strftime("%Y-%m-%d %H:%M")
             
             # 필드 추가
-            result_embed.add_field(
+            add_field(
                 name=f"{count}. {message.author.display_name} ({timestamp})",
                 value=f"채널: {channel.mention}\n내용: {content}\n[메시지 링크]({message.jump_url})",
                 inline=False
@@ -201,6 +279,20 @@ class ChannelMessages(commands.Cog):
         return result_embed
     
     def create_help_embed(self) -> discord.Embed:
+        """
+        도움말 임베드를 반환하는 동기 함수.
+        
+        내용이 고정되어 있으므로 처음 한 번만 만들고, 이후에는 캐시된 임베드의 복사본을 반환합니다.
+        
+        Returns:
+            도움말 임베드
+        """
+        if self._help_embed is None:
+            self._help_embed = self._build_help_embed()
+        
+        return self._help_embed.copy()
+    
+    def _build_help_embed(self) -> discord.Embed:
         """
         도움말 임베드를 생성하는 동기 함수.
         
@@ -229,8 +321,8 @@ class ChannelMessages(commands.Cog):
         
         # 스레드 기록 명령어
         help_embed.add_field(
-            name="!스레드기록 [스레드ID] [개수(선택)]",
-            value="특정 스레드의 채팅 기록을 가져옵니다. 개수를 지정하지 않으면 기본값은 20개입니다.",
+            name="!스레드기록 [스레드ID] [개수(선택)] [메시지ID(선택)]",
+            value="특정 스레드의 채팅 기록을 가져옵니다. 개수를 지정하지 않으면 기본값은 20개입니다. 메시지ID를 지정하면 그 이전 기록을 가져옵니다.",
             inline=False
         )
         
@@ -274,7 +366,8 @@ class ChannelMessages(commands.Cog):
             name="채널/메시지/스레드 ID 찾기",
             value=(
                 "1. 디스코드 설정에서 개발자 모드를 활성화하세요.\n"
-                "2. 채널/메시지/스레드에서 우클릭하여 'ID 복사'를 선택하세요."
+                "2. 채널/메시지/스레드에서 우클릭하여 'ID 복사'를 선택하세요.\n"
+                "3. 다른 채널의 메시지는 Shift를 누른 채 'ID 복사'로 얻은 '채널ID-메시지ID'를 입력하면 바로 찾습니다."
             ),
             inline=False
         )
@@ -328,6 +421,47 @@ class ChannelMessages(commands.Cog):
         
         return is_authorized
     
+    async def iter_recent_messages(self, channel: Any, limit: Optional[int]) -> AsyncIterator[discord.Message]:
+        """
+        채널의 최근 메시지를 최신순으로 순회하는 비동기 제너레이터.
+        
+        캐시는 현재 게이트웨이 세션에서 수신한 메시지를 빠짐없이 담고 있으므로
+        (재연결이나 메시지 수정 시 비우고, 삭제된 메시지는 제거), limit개 이상이 쌓여 있으면
+        최근 limit개는 캐시에서 바로 꺼내고 그렇지 않으면 channel.history()로 조회합니다.
+        
+        캐시를 쓰더라도 history()와 같은 권한이 있을 때만 사용하므로, 권한이 없으면
+        history()가 discord.Forbidden을 발생시킵니다.
+        
+        Args:
+            channel: 메시지를 가져올 채널 또는 스레드
+            limit: 가져올 메시지의 최대 개수 (None이면 전체)
+            
+        Yields:
+            최신순으로 정렬된 메시지
+        """
+        cached = self.message_cache.get(channel.id)
+        if limit is not None and cached is not None and len(cached) >= limit and self.can_read_history(channel):
+            for i in range(1, limit + 1):
+                yield cached[-i]
+            return
+        
+        async for message in channel.history(limit=limit):
+            yield message
+    
+    @staticmethod
+    def can_read_history(channel: Any) -> bool:
+        """
+        봇이 채널 또는 스레드의 메시지 기록을 읽을 권한이 있는지 확인합니다.
+        
+        Args:
+            channel: 확인할 채널 또는 스레드
+            
+        Returns:
+            메시지 보기와 기록 보기 권한이 모두 있으면 True
+        """
+        permissions = channel.permissions_for(channel.guild.me)
+        return permissions.read_messages and permissions.read_message_history
+    
     async def find_channel(self, channel_id: Union[str, int]) -> Optional[Any]:
         """
         채널 ID로 채널을 찾는 비동기 함수.
@@ -341,42 +475,179 @@ class ChannelMessages(commands.Cog):
         # 동기 함수 사용
         return self.get_channel_by_id(channel_id)
     
+    async def find_thread(self, ctx: commands.Context, thread_id: str) -> Optional[discord.Thread]:
+        """
+        스레드 ID로 스레드를 찾고, 찾지 못하면 안내 메시지를 보내는 비동기 함수.
+        
+        Args:
+            ctx: 명령어 컨텍스트
+            thread_id: 찾을 스레드 ID
+            
+        Returns:
+            찾은 스레드 객체 또는 None
+            
+        Raises:
+            ValueError: 스레드 ID가 숫자가 아닌 경우
+        """
+        # 동기 함수 사용
+        thread = self.get_channel_by_id(int(thread_id))
+        if not isinstance(thread, discord.Thread):
+            await ctx.send(f"스레드를 찾을 수 없습니다: {thread_id}")
+            return None
+        
+        return thread
+    
     async def find_message(self, ctx: commands.Context, message_id: Union[str, int]) -> Optional[discord.Message]:
         """
         메시지 ID로 메시지를 찾는 비동기 함수.
         
+        '채널ID-메시지ID' 형식(디스코드의 Shift+ID 복사 형식)이면 해당 채널에서 바로 찾고,
+        그렇지 않으면 현재 채널을 먼저 확인한 뒤 서버의 다른 텍스트 채널을 순서대로 확인합니다.
+        
         Args:
             ctx: 명령어 컨텍스트
-            message_id: 찾을 메시지 ID
+            message_id: 찾을 메시지 ID 또는 '채널ID-메시지ID'
             
         Returns:
             찾은 메시지 객체 또는 None
         """
         try:
-            # 메시지 ID를 정수로 변환
-            message_id_int = int(message_id) if isinstance(message_id, str) else message_id
+            # 채널 힌트와 메시지 ID 분리 (동기 함수 사용)
+            channel_hint, message_id_int = self.parse_message_reference(message_id)
             
-            # 메시지 가져오기
-            message = None
+            # 채널이 지정되었으면 해당 채널에서만 찾기 (요청 1회)
+            if channel_hint is not None:
+                try:
+                    return await channel_hint.fetch_message(message_id_int)
+                except (discord.NotFound, discord.Forbidden):
+                    return None
             
             # 현재 채널에서 메시지 찾기
             try:
-                message = await ctx.channel.fetch_message(message_id_int)
-                return message
+                return await ctx.channel.fetch_message(message_id_int)
             except discord.NotFound:
-                # 다른 채널에서 메시지 찾기
-                if ctx.guild:
-                    for channel in ctx.guild.text_channels:
-                        try:
-                            message = await channel.fetch_message(message_id_int)
-                            return message
-                        except (discord.NotFound, discord.Forbidden):
-                            continue
+                pass
+            
+            # 다른 채널에서 메시지 찾기 (기록을 읽을 수 없는 채널은 요청하지 않음)
+            if ctx.guild:
+                me = ctx.guild.me
+                for channel in ctx.guild.text_channels:
+                    if channel.id == ctx.channel.id or not channel.permissions_for(me).read_message_history:
+                        continue
+                    try:
+                        return await channel.fetch_message(message_id_int)
+                    except (discord.NotFound, discord.Forbidden):
+                        continue
             
             return None
         except (ValueError, TypeError):
             return None
     
+    # ============= 이벤트 리스너 =============
+    
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message) -> None:
+        """
+        수신한 메시지를 채널별 캐시에 추가합니다.
+        
+        Args:
+            message: 수신한 메시지
+        """
+        # DM 등은 캐시하지 않고, 서버 텍스트 채널과 스레드만 보관
+        if not isinstance(message.channel, (discord.TextChannel, discord.Thread)):
+            return
+        
+        cached = self.message_cache.get(message.channel.id)
+        if cached is None:
+            cached = self.message_cache[message.channel.id] = deque(maxlen=MESSAGE_CACHE_SIZE)
+        cached.append(message)
+    
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        """
+        새 세션으로 연결되면 캐시를 비웁니다 (연결이 끊긴 동안 놓친 메시지가 있을 수 있음).
+        """
+        self.message_cache.clear()
+    
+    @commands.Cog.listener()
+    async def on_resumed(self) -> None:
+        """
+        세션이 재개되면 캐시를 비웁니다 (재개 전후의 누락 여부를 보장할 수 없음).
+        """
+        self.message_cache.clear()
+    
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent) -> None:
+        """
+        수정된 메시지가 캐시에 있으면 해당 채널의 캐시를 비웁니다.
+        
+        메시지 하나만 빼면 캐시 중간에 빈자리가 생기므로 채널 캐시 전체를 버리고,
+        이후 조회는 history()로 최신 내용을 가져옵니다.
+        
+        Args:
+            payload: 메시지 수정 이벤트 정보
+        """
+        cached = self.message_cache.get(payload.channel_id)
+        if cached and any(message.id == payload.message_id for message in cached):
+            del self.message_cache[payload.channel_id]
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        """
+        삭제된 채널의 캐시를 제거합니다.
+        
+        Args:
+            channel: 삭제된 채널
+        """
+        self.message_cache.pop(channel.id, None)
+    
+    @commands.Cog.listener()
+    async def on_raw_thread_delete(self, payload: discord.RawThreadDeleteEvent) -> None:
+        """
+        삭제된 스레드의 캐시를 제거합니다.
+        
+        Args:
+            payload: 스레드 삭제 이벤트 정보
+        """
+        self.message_cache.pop(payload.thread_id, None)
+    
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        """
+        삭제된 메시지를 캐시에서 제거합니다.
+        
+        Args:
+            payload: 메시지 삭제 이벤트 정보
+        """
+        self._evict_cached_messages(payload.channel_id, {payload.message_id})
+    
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent) -> None:
+        """
+        일괄 삭제된 메시지를 캐시에서 제거합니다.
+        
+        Args:
+            payload: 메시지 일괄 삭제 이벤트 정보
+        """
+        self._evict_cached_messages(payload.channel_id, payload.message_ids)
+    
+    def _evict_cached_messages(self, channel_id: int, message_ids: Set[int]) -> None:
+        """
+        캐시에서 지정한 메시지들을 제거합니다.
+        
+        Args:
+            channel_id: 메시지가 있던 채널 ID
+            message_ids: 제거할 메시지 ID 집합
+        """
+        cached = self.message_cache.get(channel_id)
+        if not cached:
+            return
+        
+        remaining = [message for message in cached if message.id not in message_ids]
+        if len(remaining) != len(cached):
+            cached.clear()
+            cached.extend(remaining)
+    
     # ============= 명령어 핸들러 =============
     
     @commands.command(name="메시지전송", aliases=["메세지전송", "채널메시지"])
@@ -455,7 +726,13 @@ class ChannelMessages(commands.Cog):
             await ctx.send(f"스레드 생성 중 오류가 발생했습니다: {str(e)}")
     
     @commands.command(name="스레드기록", aliases=["스레드채팅", "채팅기록"])
-    async def get_thread_messages(self, ctx: commands.Context, thread_id: str, limit: Optional[int] = 20) -> None:
+    async def get_thread_messages(
+        self,
+        ctx: commands.Context,
+        thread_id: str,
+        limit: Optional[int] = 20,
+        before: Optional[str] = None
+    ) -> None:
         """
         특정 스레드의 채팅 기록을 가져옵니다.
         
@@ -463,35 +740,43 @@ class ChannelMessages(commands.Cog):
             ctx: 명령어 컨텍스트
             thread_id: 채팅 기록을 가져올 스레드 ID
             limit: 가져올 메시지의 최대 개수 (기본값: 20)
+            before: 이 메시지 ID보다 이전 기록을 가져옵니다 (이전 응답에 안내된 커서)
         """
         # 권한 체크
         if not await self.check_authorized(ctx):
             return
         
+        # 커서 확인
+        before_message: Optional[discord.Object] = None
+        if before is not None:
+            if not before.isdigit():
+                await ctx.send("올바른 메시지 ID를 입력해주세요.")
+                return
+            before_message = discord.Object(id=int(before))
+        
         try:
-            # 스레드 ID를 정수로 변환
-            thread_id_int = int(thread_id)
-            
-            # 스레드 가져오기 (동기 함수 사용)
-            thread = self.get_channel_by_id(thread_id_int)
-            if not thread or not isinstance(thread, discord.Thread):
-                await ctx.send(f"스레드를 찾을 수 없습니다: {thread_id}")
+            # 스레드 가져오기 (찾지 못하면 안내 후 종료)
+            thread = await self.find_thread(ctx, thread_id)
+            if thread is None:
                 return
+            thread_id_int = thread.id
             
-            # 메시지 개수 제한
+            # 메시지 개수 제한 (안내는 첫 번째 응답에 함께 표시)
+            notice = ""
             if limit and limit > 100:
                 limit = 100
-                await ctx.send("메시지 개수는 최대 100개로 제한됩니다.")
+                notice = "메시지 개수는 최대 100개로 제한됩니다.\n"
             
-            # 채팅 기록 가져오기
-            messages = []
-            async for msg in thread.history(limit=limit):
-                messages.append(msg)
+            # 채팅 기록 가져오기 (커서가 없고 캐시가 충분하면 캐시 사용)
+            if before_message is not None:
+                messages = [msg async for msg in thread.history(limit=limit, before=before_message)]
+            else:
+                messages = [msg async for msg in self.iter_recent_messages(thread, limit)]
             messages.reverse()  # 시간순으로 정렬
             
             # 메시지 내용 구성
             if not messages:
-                await ctx.send(f"스레드 <#{thread_id_int}>에 메시지가 없습니다.")
+                await ctx.send(f"{notice}스레드 <#{thread_id_int}>에 메시지가 없습니다.")
                 return
             
             # 메시지 내용을 하나의 문자열로 합침 (동기 함수 사용)
@@ -500,6 +785,11 @@ class ChannelMessages(commands.Cog):
             # 여러 메시지로 나누어 보내기 (동기 함수 사용)
             header = f"스레드 <#{thread_id_int}> 채팅 기록 (최근 {len(messages)}개):\n\n"
             chunks = self.chunk_messages(messages_content, header)
+            chunks[0] = notice + chunks[0]
+            
+            # 더 이전 기록이 있을 수 있으면 다음 조회에 쓸 커서를 마지막 청크에 안내
+            if limit is not None and len(messages) == limit:
+                chunks[-1] += f"이전 기록: `{ctx.prefix}스레드기록 {thread_id_int} {limit} {messages[0].id}`"
             
             # 메시지 전송
             for chunk in chunks:
@@ -528,14 +818,11 @@ class ChannelMessages(commands.Cog):
             return
         
         try:
-            # 스레드 ID를 정수로 변환
-            thread_id_int = int(thread_id)
-            
-            # 스레드 가져오기 (동기 함수 사용)
-            thread = self.get_channel_by_id(thread_id_int)
-            if not thread or not isinstance(thread, discord.Thread):
-                await ctx.send(f"스레드를 찾을 수 없습니다: {thread_id}")
+            # 스레드 가져오기 (찾지 못하면 안내 후 종료)
+            thread = await self.find_thread(ctx, thread_id)
+            if thread is None:
                 return
+            thread_id_int = thread.id
             
             # 메시지 전송
             await thread.send(message)
@@ -564,6 +851,25 @@ class ChannelMessages(commands.Cog):
             return
         
         try:
+            # 채널이 지정된 경우 조회 없이 바로 수정 (동기 함수 사용)
+            partial_message = self.get_partial_message(message_id)
+            if partial_message is not None:
+                try:
+                    await partial_message.edit(content=new_content)
+                except discord.NotFound:
+                    await ctx.send(f"메시지를 찾을 수 없습니다: {message_id}")
+                    return
+                except discord.Forbidden as e:
+                    # 다른 사용자의 메시지는 디스코드가 수정을 거부함
+                    if e.code == 50005:
+                        await ctx.send("봇이 보낸 메시지만 수정할 수 있습니다.")
+                        return
+                    raise
+                
+                channel_mention = self.get_channel_mention(partial_message.channel)
+                await ctx.send(f"{channel_mention} 채널의 메시지를 수정했습니다.")
+                return
+            
             # 메시지 찾기
             message = await self.find_message(ctx, message_id)
             if not message:
@@ -647,60 +953,85 @@ class ChannelMessages(commands.Cog):
         if not await self.check_authorized(ctx):
             return
         
-        # 안내 메시지
-        searching_msg = await ctx.send(f"키워드 `{keyword}`를 포함하는 메시지를 검색 중입니다...")
+        # 서버가 존재하는 경우에만 검색
+        if not ctx.guild:
+            await ctx.send("이 명령어는 서버 내에서만 사용 가능합니다.")
+            return
+        
+        # 검색 범위 제한 (None이면 채널 전체 기록을 페이지 단위로 모두 조회하므로 기본값 사용)
+        notice = ""
+        if limit is None:
+            limit = 100
+        elif limit > 500:
+            limit = 500
+            notice = "검색 범위는 최대 500개 메시지로 제한됩니다.\n"
+        
+        # 안내 메시지 (제한 안내를 함께 표시하여 응답 한 번으로 처리)
+        searching_msg = await ctx.send(f"{notice}키워드 `{keyword}`를 포함하는 메시지를 검색 중입니다...")
         
         try:
             # 검색 결과 저장 리스트
             found_messages = []
             
-            # 검색 범위 제한
-            if limit is not None and limit > 500:
-                limit = 500
-                await ctx.send("검색 범위는 최대 500개 메시지로 제한됩니다.")
+            # 기록을 읽을 수 있는 텍스트 채널만 검색 대상으로 선정
+            me = ctx.guild.me
+            channels = [channel for channel in ctx.guild.text_channels if channel.permissions_for(me).read_message_history]
             
-            # 서버가 존재하는 경우에만 검색
-            if not ctx.guild:
-                await ctx.send("이 명령어는 서버 내에서만 사용 가능합니다.")
-                return
-            
-            # 진행 상황 표시 횟수 제한
+            # 확인한 채널 수 (진행 상황 표시용, 검색 대상 채널 기준)
             progress_counter = 0
-            progress_interval = 5
+            total_channels = len(channels)
             
-            # 모든 텍스트 채널에서 검색
-            for channel in ctx.guild.text_channels:
-                try:
-                    # 권한 확인
-                    if not channel.permissions_for(ctx.guild.me).read_message_history:
-                        continue
+            # 키워드는 대소문자를 구분하지 않는 정규식으로 한 번만 컴파일
+            keyword_pattern = re.compile(re.escape(keyword), re.IGNORECASE)
+            
+            # 동시에 검색할 채널 수 제한
+            semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+            
+            async def scan_channel(channel: discord.TextChannel) -> None:
+                nonlocal progress_counter
+                async with semaphore:
+                    # 이미 충분한 결과를 찾았으면 검색하지 않음
+                    if len(found_messages) >= MAX_SEARCH_RESULTS:
+                        return
                     
-                    # 진행 상황 표시
                     progress_counter += 1
-                    if progress_counter % progress_interval == 0:
-                        await searching_msg.edit(content=f"키워드 `{keyword}`를 포함하는 메시지를 검색 중입니다... ({progress_counter}/{len(ctx.guild.text_channels)} 채널 확인 중)")
-                    
-                    # 채널 메시지 검색
-                    async for message in channel.history(limit=limit):
-                        if keyword.lower() in message.content.lower():
-                            found_messages.append({
-                                'channel': channel,
-                                'message': message,
-                                'timestamp': message.created_at
-                            })
-                            
-                            # 최대 20개까지만 저장
-                            if len(found_messages) >= 20:
-                                break
-                    
-                    # 최대 20개를 넘어가면 검색 중단
-                    if len(found_messages) >= 20:
-                        break
-                        
-                except discord.Forbidden:
-                    pass
-                except Exception as e:
-                    logger.error(f"채널 {channel.name} 검색 중 오류: {str(e)}", exc_info=True)
+                    try:
+                        # 채널 메시지 검색
+                        async for message in self.iter_recent_messages(channel, limit):
+                            if keyword_pattern.search(message.content):
+                                found_messages.append({
+                                    'channel': channel,
+                                    'message': message,
+                                    'timestamp': message.created_at
+                                })
+                                
+                                # 최대 개수를 넘어가면 검색 중단
+                                if len(found_messages) >= MAX_SEARCH_RESULTS:
+                                    break
+                    except discord.Forbidden:
+                        pass
+                    except Exception as e:
+                        logger.error(f"채널 {channel.name} 검색 중 오류: {str(e)}", exc_info=True)
+            
+            async def report_progress() -> None:
+                # 채널 처리 순서와 무관하게 일정 간격으로만 진행 상황 메시지 수정
+                while True:
+                    await asyncio.sleep(SEARCH_PROGRESS_INTERVAL)
+                    try:
+                        await searching_msg.edit(content=f"키워드 `{keyword}`를 포함하는 메시지를 검색 중입니다... ({progress_counter}/{total_channels} 채널 확인 중)")
+                    except discord.HTTPException as e:
+                        logger.warning(f"진행 상황 메시지 수정 중 오류 발생: {str(e)}")
+            
+            # 모든 채널을 동시에 검색
+            progress_task = asyncio.create_task(report_progress())
+            try:
+                await asyncio.gather(*(scan_channel(channel) for channel in channels))
+            finally:
+                progress_task.cancel()
+            
+            # 동시에 검색하므로 최대 개수를 조금 넘을 수 있어 최신순 정렬 후 잘라냄
+            found_messages.sort(key=lambda x: x['timestamp'], reverse=True)
+            del found_messages[MAX_SEARCH_RESULTS:]
             
             # 검색 완료 메시지
             await searching_msg.edit(content=f"검색이 완료되었습니다. 키워드 `{keyword}`를 포함하는 메시지를 {len(found_messages)}개 찾았습니다.")
@@ -710,9 +1041,6 @@ class ChannelMessages(commands.Cog):
                 await ctx.send(f"키워드 `{keyword}`를 포함하는 메시지를 찾을 수 없습니다.")
                 return
             
-            # 결과 정렬 (최신 메시지부터)
-            found_messages.sort(key=lambda x: x['timestamp'], reverse=True)
-            
             # 결과 표시 (동기 함수 사용)
             result_embed = self.create_search_result_embed(keyword, found_messages)
             
@@ -757,10 +1085,11 @@ class ChannelMessages(commands.Cog):
             await ctx.send("이 명령어는 서버 내에서만 사용 가능합니다.")
             return
             
-        # 메시지 삭제 제한 설정
+        # 메시지 삭제 제한 설정 (안내는 진행 상황 메시지에 함께 표시)
+        notice = ""
         if limit is not None and limit > 1000:
             limit = 1000
-            await ctx.send("안전을 위해 메시지 삭제는 최대 1000개로 제한됩니다.")
+            notice = "안전을 위해 메시지 삭제는 최대 1000개로 제한됩니다.\n"
         
         try:
             # 채널 찾기 (동기 함수 사용)
@@ -775,7 +1104,7 @@ class ChannelMessages(commands.Cog):
                 return
             
             # 채널에 대한 권한 확인 - 좀 더 명확하게 타입 처리
-            channel_typed = discord.utils.get(ctx.guild.text_channels, id=int(channel_id))
+            channel_typed = ctx.guild.get_channel(int(channel_id))  # 길드 채널 캐시에서 바로 조회
             if not channel_typed:
                 await ctx.send(f"채널을 찾을 수 없습니다: {channel_id}")
                 return
@@ -786,20 +1115,27 @@ class ChannelMessages(commands.Cog):
                 await ctx.send("서버 정보를 가져올 수 없습니다.")
                 return
                 
-            if not channel_typed.permissions_for(me).manage_threads:
-                await ctx.send("해당 채널의 스레드를 관리할 권한이 없습니다.")
-                return
-            
-            if not channel_typed.permissions_for(me).manage_messages:
-                await ctx.send("해당 채널의 메시지를 관리할 권한이 없습니다.")
+            # 권한은 한 번만 계산하여 재사용하고, 부족한 권한은 한 번에 안내
+            permissions = channel_typed.permissions_for(me)
+            missing_permissions = []
+            if not permissions.manage_threads:
+                missing_permissions.append("스레드")
+            if not permissions.manage_messages:
+                missing_permissions.append("메시지")
+            
+            if missing_permissions:
+                await ctx.send(f"{notice}해당 채널의 {'와 '.join(missing_permissions)}를 관리할 권한이 없습니다.")
                 return
             
-            # 진행 상황 메시지
-            progress_msg = await ctx.send(f"채널 {channel_typed.mention} 정리 시작... 스레드를 확인 중입니다.")
-            
             # 스레드 수 확인 (동기 함수 사용)
             thread_count = self.count_active_threads(channel_typed)
             
+            # 진행 상황 메시지 (스레드가 없으면 처음부터 메시지 삭제 단계를 안내하여 편집 요청 생략)
+            if thread_count > 0:
+                progress_msg = await ctx.send(f"{notice}채널 {channel_typed.mention} 정리 시작... 스레드를 확인 중입니다.")
+            else:
+                progress_msg = await ctx.send(f"{notice}채널 {channel_typed.mention}에 삭제할 스레드가 없습니다. 메시지 삭제를 시작합니다...")
+            
             # 메시지 업데이트 실패 시 대비 안전 장치
             async def safe_edit(message, content):
                 try:
@@ -815,27 +1151,17 @@ class ChannelMessages(commands.Cog):
                     except:
                         logger.error("메시지 전송도 실패했습니다.")
             
-            # 스레드 삭제 진행
+            # 스레드 삭제 진행 (동시 삭제)
             deleted_threads = 0
-            for thread in channel_typed.threads:
-                try:
-                    await thread.delete()
-                    deleted_threads += 1
-                    # 진행 상황 업데이트 (5개 단위)
-                    if deleted_threads % 5 == 0 or deleted_threads == thread_count:
-                        await safe_edit(progress_msg, f"채널 {channel_typed.mention} 정리 중... {deleted_threads}/{thread_count} 스레드 삭제 완료")
-                except Exception as e:
-                    logger.error(f"스레드 삭제 중 오류 발생: {str(e)}", exc_info=True)
-            
-            # 스레드 삭제 완료 메시지
             if thread_count > 0:
+                deleted_threads = await delete_threads(channel_typed.threads)
+                
+                # 스레드 삭제 완료 메시지
                 await safe_edit(progress_msg, f"채널 {channel_typed.mention}의 모든 스레드({deleted_threads}개) 삭제 완료. 메시지 삭제를 시작합니다...")
-            else:
-                await safe_edit(progress_msg, f"채널 {channel_typed.mention}에 삭제할 스레드가 없습니다. 메시지 삭제를 시작합니다...")
             
             # 메시지 삭제
             try:
-                deleted_count = await channel_typed.purge(limit=limit)
+                deleted_count = await purge_channel_messages(channel_typed, limit)
                 await ctx.send(f"채널 {channel_typed.mention} 정리 완료! {deleted_threads}개의 스레드와 {len(deleted_count)}개의 메시지를 삭제했습니다.")
             except discord.errors.HTTPException as e:
                 logger.error(f"메시지 삭제 중 HTTP 오류 발생: {str(e)}", exc_info=True)
@@ -10,17 +10,33 @@
 import asyncio
 import logging
 import os
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import discord
-import yaml
 from discord.ext import commands
 
 from services.lostark_service import LostarkService, collect_and_save_character_info
+from utils.config_utils import load_yaml_config
 
 # 로깅 설정
 logger = logging.getLogger("lostark_cog")
 
+# 멤버 설정 파일 경로
+MEMBERS_CONFIG_PATH = "configs/members_config.yaml"
+
+
+def item_level_key(character: Dict) -> float:
+    """
+    캐릭터의 아이템 레벨을 정렬/비교용 숫자로 변환합니다.
+    
+    Args:
+        character: 캐릭터 정보
+        
+    Returns:
+        아이템 레벨 (예: "1,620.00" -> 1620.0)
+    """
+    return float(character.get('ItemMaxLevel', '0').replace(',', ''))
+
 
 class Lostark(commands.Cog):
     """
@@ -39,6 +55,9 @@ class Lostark(commands.Cog):
         self.bot = bot
         self.lostark_service = LostarkService()
         
+        # 멤버 설정 기반 인덱스 캐시 (설정 파일 수정 시각, member_info, discord_id_to_member)
+        self._member_index_cache: Optional[Tuple[int, Dict[str, Dict[str, Any]], Dict[str, str]]] = None
+        
         # 봇 시작시 자동으로 멤버 정보 수집하지 않음
         # self.bot.loop.create_task(self._init_character_data())
     
@@ -53,6 +72,38 @@ class Lostark(commands.Cog):
         except Exception as e:
             logger.error(f"캐릭터 정보 초기화 실패: {str(e)}")
     
+    def _get_member_indices(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """
+        멤버 설정 파일로부터 멤버 조회용 인덱스를 가져옵니다.
+        
+        설정 파일이 변경되지 않았다면 이전에 만든 인덱스를 재사용합니다.
+        
+        Returns:
+            (discord_id별 멤버 정보, 멤버 ID -> discord_id 매핑) 튜플
+        """
+        mtime_ns = os.stat(MEMBERS_CONFIG_PATH).st_mtime_ns
+        if self._member_index_cache is not None and self._member_index_cache[0] == mtime_ns:
+            return self._member_index_cache[1], self._member_index_cache[2]
+        
+        members_config = self.lostark_service._load_members_config(MEMBERS_CONFIG_PATH)
+        member_info = {}
+        # discord_id를 키로 하는 매핑 생성
+        discord_id_to_member = {}
+        for member in members_config:
+            member_id = member.get('id')
+            discord_id = member.get('discord_id', '')
+            
+            member_info[discord_id] = {
+                'id': member_id,
+                'discord_name': member.get('discord_name', '알 수 없음'),
+                'active': member.get('active', False)
+            }
+            
+            discord_id_to_member[member_id] = discord_id
+        
+        self._member_index_cache = (mtime_ns, member_info, discord_id_to_member)
+        return member_info, discord_id_to_member
+    
     @commands.command(name="캐릭터갱신", aliases=["캐릭터업데이트", "캐릭터수집"])
     @commands.is_owner()  # 봇 소유자만 실행 가능
     async def update_characters(self, ctx: commands.Context) -> None:
@@ -66,8 +117,8 @@ class Lostark(commands.Cog):
             # 비동기적으로 캐릭터 정보 수집 실행
             data = await self.lostark_service.collect_all_members_characters_async()
             
-            # 데이터 저장
-            self.lostark_service.save_members_characters_info(data)
+            # 데이터 저장 (YAML 직렬화가 이벤트 루프를 막지 않도록 작업 스레드에서 실행)
+            await asyncio.to_thread(self.lostark_service.save_members_characters_info, data)
             
             # 결과 요약
             total_members = len(data)
@@ -95,30 +146,11 @@ class Lostark(commands.Cog):
             return
         
         try:
-            # 캐릭터 정보 로드
-            with open(character_file_path, 'r', encoding='utf-8') as file:
-                character_data = self.lostark_service._load_members_config()
-                data = {}
-                
-                # 멤버 설정 파일에서 멤버 정보 가져오기 (discord_name 등)
-                member_info = {}
-                # discord_id를 키로 하는 매핑 생성
-                discord_id_to_member = {}
-                for member in character_data:
-                    member_id = member.get('id')
-                    discord_id = member.get('discord_id', '')
-                    
-                    member_info[discord_id] = {
-                        'id': member_id,
-                        'discord_name': member.get('discord_name', '알 수 없음'),
-                        'active': member.get('active', False)
-                    }
-                    
-                    discord_id_to_member[member_id] = discord_id
+            # 멤버 설정 파일에서 멤버 정보 가져오기 (discord_name 등, 설정이 바뀌지 않았으면 캐시 사용)
+            member_info, discord_id_to_member = await asyncio.to_thread(self._get_member_indices)
             
-            # 캐릭터 정보 파일 로드
-            with open(character_file_path, 'r', encoding='utf-8') as file:
-                data = yaml.safe_load(file) or {}
+            # 캐릭터 정보 파일 로드 (파일이 변경되지 않았으면 이전 파싱 결과 재사용)
+            data = await asyncio.to_thread(load_yaml_config, character_file_path)
             
             # 특정 멤버 지정된 경우
             if member_id:
@@ -146,12 +178,8 @@ class Lostark(commands.Cog):
                     color=discord.Color.blue()
                 )
                 
-                # 캐릭터 정보를 아이템 레벨 내림차순으로 정렬
-                sorted_characters = sorted(
-                    member_characters,
-                    key=lambda x: float(x.get('ItemMaxLevel', '0').replace(',', '')),
-                    reverse=True
-                )
+                # 캐릭터 정보를 아이템 레벨 내림차순으로 정렬 (키는 캐릭터마다 한 번만 계산됨)
+                sorted_characters = sorted(member_characters, key=item_level_key, reverse=True)
                 
                 # 임베드에 캐릭터 정보 추가
                 for character in sorted_characters:
@@ -186,10 +214,7 @@ class Lostark(commands.Cog):
                     discord_name = member_info.get(discord_id, {}).get('discord_name', '알 수 없음')
                     
                     # 최고 레벨 캐릭터 찾기
-                    highest_character = max(
-                        characters,
-                        key=lambda x: float(x.get('ItemMaxLevel', '0').replace(',', ''))
-                    )
+                    highest_character = max(characters, key=item_level_key)
                     
                     highest_level = highest_character.get('ItemMaxLevel', '0')
                     highest_name = highest_character.get('CharacterName', '알 수 없음')
@@ -7,6 +7,7 @@
 이 모듈은 레이드 정보 조회 및 레이드 관련 스레드 생성 기능을 제공합니다.
 """
 
+import asyncio
 import logging
 import os
 from typing import Dict, List, Any, Optional
@@ -14,9 +15,12 @@ from typing import Dict, List, Any, Optional
 import discord
 from discord.ext import commands
 
-from utils.config_utils import load_yaml_config, format_raid_message
+from utils.config_utils import aload_yaml_config, format_raid_message
 from utils.discord_utils import (
+    RAID_COMMAND_PREFIXES,
+    RAID_COMMAND_TYPES,
     send_raid_info, 
+    post_eligible_characters_to_thread,
     add_command_to_raid_history, 
     get_raid_command_history,
     process_raid_commands_and_update_schedule,
@@ -47,27 +51,139 @@ class Raids(commands.Cog):
         self.bot = bot
         self.raids_config_path = "configs/raids_config.yaml"
         self.openai_service = OpenAIService()
+        
+        # 검증을 통과한 레이드 목록과, 그 목록을 만든 원본 설정 목록
+        self._valid_raids: List[Dict[str, Any]] = []
+        self._valid_raids_source: Optional[List[Any]] = None
+        # 소문자 레이드 이름 -> 레이드 정보 목록 인덱스와, 인덱스를 만든 레이드 목록
+        self._raids_by_name: Dict[str, List[Dict[str, Any]]] = {}
+        self._raids_index_source: Optional[List[Dict[str, Any]]] = None
+    
+    async def cog_load(self) -> None:
+        """
+        Cog 로드 시 레이드 설정을 미리 읽고 검증해 캐시와 이름 인덱스를 채웁니다.
+        """
+        raids = await self.aget_raids_config()
+        logger.info(f"레이드 설정 로드 완료: {len(raids)}개")
+    
+    async def cog_unload(self) -> None:
+        """
+        Cog 언로드 시 OpenAI 서비스가 재사용하던 HTTP 세션을 닫습니다.
+        """
+        await self.openai_service.close()
+    
+    @staticmethod
+    def validate_raid(raid: Any) -> List[str]:
+        """
+        레이드 설정 항목의 필수 값과 타입을 확인합니다.
+        
+        Args:
+            raid: 레이드 정보
+            
+        Returns:
+            발견된 문제 목록 (문제가 없으면 빈 리스트)
+        """
+        if not isinstance(raid, dict):
+            return ["항목이 매핑이 아님"]
+        
+        problems = []
+        name = raid.get("name")
+        if not name or not isinstance(name, str):
+            problems.append("name이 비어 있거나 문자열이 아님")
+        if not isinstance(raid.get("min_level"), (int, float)):
+            problems.append("min_level이 숫자가 아님")
+        max_level = raid.get("max_level")
+        if max_level is not None and not isinstance(max_level, (int, float)):
+            problems.append("max_level이 숫자 또는 null이 아님")
+        if not isinstance(raid.get("members"), int):
+            problems.append("members가 정수가 아님")
+        return problems
     
-    def get_raids_config(self) -> List[Dict[str, Any]]:
+    async def aget_raids_config(self) -> List[Dict[str, Any]]:
         """
-        레이드 설정 정보를 로드합니다.
+        레이드 설정 정보를 비동기적으로 로드합니다 (파일 확인과 파싱은 작업 스레드에서 실행).
         
         Returns:
-            레이드 정보 리스트
+            검증을 통과한 레이드 정보 리스트
         """
         try:
-            config = load_yaml_config(self.raids_config_path)
-            return config.get("raids", [])
+            config = await aload_yaml_config(self.raids_config_path)
+            raids = config.get("raids", [])
         except Exception as e:
             logger.error(f"레이드 설정 파일 로드 실패: {str(e)}")
             return []
+        return self._validated_raids(raids)
+    
+    def _validated_raids(self, raids: List[Any]) -> List[Dict[str, Any]]:
+        """
+        설정에서 읽은 레이드 목록 중 검증을 통과한 항목만 돌려줍니다.
+        
+        설정 캐시가 같은 목록을 돌려주는 동안에는 이전 결과를 재사용하므로,
+        잘못된 항목은 설정 파일이 바뀔 때마다 한 번만 보고됩니다.
+        
+        Args:
+            raids: 레이드 설정에서 로드한 원본 레이드 목록
+            
+        Returns:
+            검증된 레이드 정보 리스트 (공유 설정 캐시를 건드리지 않도록 얕은 복사본)
+        """
+        if raids is self._valid_raids_source:
+            return self._valid_raids
+        
+        valid_raids = []
+        for index, raid in enumerate(raids or []):
+            problems = self.validate_raid(raid)
+            if problems:
+                logger.error(f"레이드 설정 {index + 1}번째 항목 제외 ({', '.join(problems)}): {raid!r}")
+                continue
+            valid_raids.append(dict(raid))
+        
+        self._valid_raids = valid_raids
+        self._valid_raids_source = raids
+        # 이름 인덱스도 미리 생성
+        self._index_raids(valid_raids)
+        return valid_raids
+    
+    def find_raids_by_name(self, raids: List[Dict[str, Any]], raid_name: str) -> List[Dict[str, Any]]:
+        """
+        이름이 일치하는 레이드 정보를 찾습니다 (대소문자 구분 없음).
+        
+        설정 파일이 변경되지 않았다면 이전에 만든 이름 인덱스를 재사용합니다.
+        
+        Args:
+            raids: 검증된 레이드 정보 리스트
+            raid_name: 레이드 이름
+            
+        Returns:
+            이름이 일치하는 레이드 정보 리스트 (설정 파일 순서)
+        """
+        self._index_raids(raids)
+        return self._raids_by_name.get(raid_name.lower(), [])
+    
+    def _index_raids(self, raids: List[Dict[str, Any]]) -> None:
+        """
+        레이드 이름 인덱스를 만듭니다.
+        
+        설정 캐시가 같은 목록을 돌려주는 동안에는 인덱스를 다시 만들지 않습니다.
+        
+        Args:
+            raids: 검증된 레이드 정보 리스트
+        """
+        if raids is self._raids_index_source:
+            return
+        
+        raids_by_name: Dict[str, List[Dict[str, Any]]] = {}
+        for raid in raids:
+            raids_by_name.setdefault(raid["name"].lower(), []).append(raid)
+        self._raids_by_name = raids_by_name
+        self._raids_index_source = raids
     
     @commands.command(name="레이드목록", aliases=["레이드리스트", "레이드정보"])
     async def list_raids(self, ctx: commands.Context) -> None:
         """
         레이드 목록을 조회하고 표시합니다.
         """
-        raids = self.get_raids_config()
+        raids = await self.aget_raids_config()
         
         if not raids:
             await ctx.send("레이드 정보를 찾을 수 없습니다.")
@@ -107,7 +223,7 @@ class Raids(commands.Cog):
             ctx: 명령어 컨텍스트
             raid_name: 레이드 이름 (지정하지 않으면 모든 레이드 정보 생성)
         """
-        raids = self.get_raids_config()
+        raids = await self.aget_raids_config()
         
         if not raids:
             await ctx.send("레이드 정보를 찾을 수 없습니다.")
@@ -115,7 +231,7 @@ class Raids(commands.Cog):
         
         # 레이드 이름이 지정된 경우 해당 레이드만 필터링
         if raid_name:
-            filtered_raids = [raid for raid in raids if raid.get("name", "").lower() == raid_name.lower()]
+            filtered_raids = self.find_raids_by_name(raids, raid_name)
             if not filtered_raids:
                 await ctx.send(f"'{raid_name}' 레이드를 찾을 수 없습니다.")
                 return
@@ -124,10 +240,22 @@ class Raids(commands.Cog):
         # min_level 기준으로 레이드를 오름차순 정렬
         sorted_raids = sorted(raids, key=lambda x: x.get("min_level", 0))
         
-        # 각 레이드에 대한 메시지 생성 및 스레드 생성
+        # 각 레이드에 대한 메시지 생성 및 스레드 생성 (채널 내 순서를 지키기 위해 순차 전송)
+        created_threads = []
         for raid in sorted_raids:
-            # 공통 유틸리티 함수 사용
-            await send_raid_info(self.bot, ctx.channel.id, raid)
+            # 공통 유틸리티 함수 사용 (캐릭터 목록은 모든 스레드 생성 후 한꺼번에 게시)
+            thread = await send_raid_info(self.bot, ctx.channel.id, raid, post_characters=False)
+            if thread:
+                created_threads.append((thread, raid))
+        
+        # 스레드별 참여 가능 캐릭터 게시는 서로 독립적이므로 동시에 진행
+        results = await asyncio.gather(
+            *(post_eligible_characters_to_thread(self.bot, thread, raid) for thread, raid in created_threads),
+            return_exceptions=True,
+        )
+        for (thread, _), result in zip(created_threads, results):
+            if isinstance(result, Exception):
+                logger.error(f"'{thread.name}' 스레드에 캐릭터 정보 게시 실패: {result}")
     
     async def get_raid_info_async(self, raid_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -139,11 +267,9 @@ class Raids(commands.Cog):
         Returns:
             레이드 정보 딕셔너리 또는 None
         """
-        raids = self.get_raids_config()
-        for raid in raids:
-            if raid.get("name", "").lower() == raid_name.lower():
-                return raid
-        return None
+        raids = await self.aget_raids_config()
+        matching_raids = self.find_raids_by_name(raids, raid_name)
+        return matching_raids[0] if matching_raids else None
 
     @commands.command(name="스케줄", aliases=["일정", "레이드일정", "레이드스케줄"])
     async def show_raid_schedule(self, ctx: commands.Context) -> None:
@@ -181,28 +307,26 @@ class Raids(commands.Cog):
             dps_list = round_data.get("dps", [])
             sup_list = round_data.get("sup", [])
             
-            # 필드 값 생성
-            value = f"시간: {round_time if round_time else '미정'}\n"
+            # 필드 값 생성 (줄 목록을 모아 한 번에 연결)
+            lines = [f"시간: {round_time if round_time else '미정'}"]
             
             # DPS 목록
-            value += "**DPS**:\n"
+            lines.append("**DPS**:")
             if dps_list:
-                for i, dps_id in enumerate(dps_list):
-                    value += f"{i+1}. <@{dps_id}>\n"
+                lines.extend(f"{i}. <@{dps_id}>" for i, dps_id in enumerate(dps_list, 1))
             else:
-                value += "- 없음\n"
+                lines.append("- 없음")
                 
             # 서포터 목록
-            value += "**서포터**:\n"
+            lines.append("**서포터**:")
             if sup_list:
-                for i, sup_id in enumerate(sup_list):
-                    value += f"{i+1}. <@{sup_id}>\n"
+                lines.extend(f"{i}. <@{sup_id}>" for i, sup_id in enumerate(sup_list, 1))
             else:
-                value += "- 없음\n"
+                lines.append("- 없음")
             
             embed.add_field(
                 name=f"{round_idx}차",
-                value=value,
+                value="\n".join(lines) + "\n",
                 inline=False
             )
         
@@ -224,31 +348,18 @@ class Raids(commands.Cog):
         # 봇 메시지 무시
         if message.author.bot:
             return
+        
+        # 명령어 접두사 확인 (대부분의 메시지는 여기서 바로 종료)
+        content = message.content.strip()
+        if not content.startswith(RAID_COMMAND_PREFIXES):
+            return
             
         # 스레드인지 확인
         if not isinstance(message.channel, discord.Thread):
             return
-            
-        # 명령어 접두사 확인
-        content = message.content.strip()
-        
-        command_map = {
-            "!추가": "add",
-            "!제거": "remove",
-            "!수정": "edit"
-        }
         
-        command_prefix = None
-        command_type = None
-        
-        for prefix, cmd_type in command_map.items():
-            if content.startswith(prefix):
-                command_prefix = prefix
-                command_type = cmd_type
-                break
-                
-        if not command_prefix:
-            return
+        command_prefix = next(prefix for prefix in RAID_COMMAND_PREFIXES if content.startswith(prefix))
+        command_type = RAID_COMMAND_TYPES[command_prefix]
             
         # 명령어 텍스트 추출
         command_text = content[len(command_prefix):].strip()
@@ -22,28 +22,27 @@ from services.openai_service import OpenAIService
 
 async def test_command_parsing():
     """커맨드 파싱 테스트"""
-    service = OpenAIService()
-    
-    # 테스트할 명령어 목록
-    test_commands = [
-        "추가 1딜",
-        "추가 1폿",
-        "추가 1딜 1폿",
-        "추가 2딜 2폿",
-        "추가 1차 딜러",
-        "제거 1차 딜러",
-        "수정 1차 토 21시"
-    ]
-    
-    for cmd in test_commands:
-        logger.info(f"========== 테스트 명령어: {cmd} ==========")
-        result = await service.parse_raid_command("test_user", cmd)
-        logger.info(f"파싱 결과: {result}")
+    async with OpenAIService() as service:
+        # 테스트할 명령어 목록
+        test_commands = [
+            "추가 1딜",
+            "추가 1폿",
+            "추가 1딜 1폿",
+            "추가 2딜 2폿",
+            "추가 1차 딜러",
+            "제거 1차 딜러",
+            "수정 1차 토 21시"
+        ]
         
-        # 검증 및 포맷팅 테스트
-        formatted = await service.validate_and_format_commands(result, "test_user")
-        logger.info(f"포맷팅 결과: {formatted}")
-        logger.info(f"========== 테스트 완료 ==========\n")
+        for cmd in test_commands:
+            logger.info(f"========== 테스트 명령어: {cmd} ==========")
+            result = await service.parse_raid_command("test_user", cmd)
+            logger.info(f"파싱 결과: {result}")
+            
+            # 검증 및 포맷팅 테스트
+            formatted = await service.validate_and_format_commands(result, "test_user")
+            logger.info(f"포맷팅 결과: {formatted}")
+            logger.info(f"========== 테스트 완료 ==========\n")
 
 
 async def main():
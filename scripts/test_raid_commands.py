@@ -162,32 +162,31 @@ async def run_tests(thread_id: int) -> None:
         thread_id: 레이드 스레드 ID
     """
     # OpenAI 서비스 초기화
-    openai_service = OpenAIService()
-    
-    # 테스트용 사용자 ID
-    user_id = "test_user_123"
-    
-    # 테스트할 명령어 목록
-    test_commands = [
-        "!추가 1딜 1폿",
-        "!추가 1차 1딜",
-        "!제거 1딜",
-        "!수정 1차 목 9시"
-    ]
-    
-    # 각 명령어 테스트
-    for command in test_commands:
-        # 명령어 텍스트 추출
-        if command.startswith("!"):
-            command_text = command[1:].strip()
-        else:
-            command_text = command.strip()
-            
-        # 명령어 처리 테스트
-        await test_command_processing(thread_id, openai_service, user_id, command_text)
+    async with OpenAIService() as openai_service:
+        # 테스트용 사용자 ID
+        user_id = "test_user_123"
+        
+        # 테스트할 명령어 목록
+        test_commands = [
+            "!추가 1딜 1폿",
+            "!추가 1차 1딜",
+            "!제거 1딜",
+            "!수정 1차 목 9시"
+        ]
         
-        # 테스트 간 간격
-        await asyncio.sleep(1)
+        # 각 명령어 테스트
+        for command in test_commands:
+            # 명령어 텍스트 추출
+            if command.startswith("!"):
+                command_text = command[1:].strip()
+            else:
+                command_text = command.strip()
+                
+            # 명령어 처리 테스트
+            await test_command_processing(thread_id, openai_service, user_id, command_text)
+            
+            # 테스트 간 간격
+            await asyncio.sleep(1)
 
 
 async def main() -> None:
@@ -205,8 +204,8 @@ async def main() -> None:
     
     # 단일 명령어 테스트
     if args.command:
-        openai_service = OpenAIService()
-        await test_command_processing(thread_id, openai_service, "test_user_123", args.command)
+        async with OpenAIService() as openai_service:
+            await test_command_processing(thread_id, openai_service, "test_user_123", args.command)
     else:
         # 모든 테스트 실행
         await run_tests(thread_id)
@@ -256,14 +256,12 @@ async def main() -> None:
         display_all_schedules()
         return
     
-    # OpenAI 서비스 초기화
-    openai_service = OpenAIService()
-    
     # 테스트용 사용자 ID 목록
     user_ids = [f"user_{i}" for i in range(1, 10)]
     
-    # 테스트 명령어 추가
-    await add_test_commands(thread_id, openai_service, user_ids)
+    # OpenAI 서비스 초기화 후 테스트 명령어 추가 (블록을 벗어나면 HTTP 세션을 닫음)
+    async with OpenAIService() as openai_service:
+        await add_test_commands(thread_id, openai_service, user_ids)
     
     # 히스토리 표시
     display_raid_history(thread_id)
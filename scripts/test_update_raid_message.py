@@ -332,11 +332,9 @@ async def main() -> None:
     thread_id = args.thread_id if args.thread_id else create_test_raid_data()
     thread_name = f"테스트_레이드_{thread_id}"
     
-    # OpenAI 서비스 초기화
-    openai_service = OpenAIService()
-    
-    # 테스트 명령어 추가
-    await add_test_commands(thread_id, openai_service)
+    # OpenAI 서비스 초기화 후 테스트 명령어 추가 (블록을 벗어나면 HTTP 세션을 닫음)
+    async with OpenAIService() as openai_service:
+        await add_test_commands(thread_id, openai_service)
     
     # 업데이트된 메시지 생성
     updated_message = generate_updated_message(thread_id, thread_name)
@@ -11,17 +11,41 @@ import asyncio
 import json
 import logging
 import os
+import time
 import urllib.parse
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 import aiohttp
 import requests
 import yaml
 from dotenv import load_dotenv
 
+from utils.config_utils import YAML_LOADER, load_yaml_config, save_yaml_file
+
+# orjson이 설치되어 있으면 더 빠른 C 구현 JSON 파서 사용 (선택 사항)
+try:
+    import orjson
+    JSON_LOADS = orjson.loads
+except ImportError:
+    JSON_LOADS = json.loads
+
 # 로깅 설정
 logger = logging.getLogger("lostark_service")
 
+# 캐릭터 정보 API 동시 요청 수 제한
+API_REQUEST_CONCURRENCY = 8
+
+# 남은 요청 수가 이 값 이하로 떨어지면 제한이 초기화될 때까지 요청을 멈춤
+# (동시에 진행 중인 요청이 모두 응답을 받아도 제한을 넘지 않도록 동시 요청 수 이상으로 설정)
+RATE_LIMIT_REMAINING_THRESHOLD = API_REQUEST_CONCURRENCY
+
+# 요청 제한(429) 응답 시 재시도 횟수와 지수 백오프 최대 대기 시간 (초)
+RATE_LIMIT_MAX_RETRIES = 5
+RATE_LIMIT_MAX_BACKOFF = 60.0
+
+# 수집한 멤버 캐릭터 정보 파일 경로
+CHARACTER_INFO_PATH = "data/members_character_info.yaml"
+
 
 class LostarkService:
     """
@@ -39,8 +63,11 @@ class LostarkService:
         if api_key:
             self.api_key = api_key
         else:
-            load_dotenv(".env.secret")
+            # 이미 환경 변수에 있으면 .env.secret 파일을 다시 읽지 않음
             self.api_key = os.getenv("LOSTARK_API_KEY")
+            if not self.api_key:
+                load_dotenv(".env.secret")
+                self.api_key = os.getenv("LOSTARK_API_KEY")
             if not self.api_key:
                 raise ValueError("LOSTARK_API_KEY 환경 변수가 설정되지 않았습니다.")
         
@@ -49,6 +76,13 @@ class LostarkService:
             'accept': 'application/json',
             'authorization': f'bearer {self.api_key}'
         }
+        
+        # 동기 요청용 HTTP 세션 (연결을 재사용하여 요청마다 TLS 핸드셰이크를 반복하지 않음)
+        self.http_session = requests.Session()
+        self.http_session.headers.update(self.headers)
+        
+        # API 요청 제한이 초기화되는 시각 (epoch 초). 이 시각 전에는 비동기 요청을 보내지 않음
+        self._rate_limit_reset_at = 0.0
 
     def _load_members_config(self, config_path: str = "configs/members_config.yaml") -> List[Dict[str, Any]]:
         """
@@ -62,39 +96,108 @@ class LostarkService:
         """
         try:
             with open(config_path, 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
+                config = yaml.load(file, Loader=YAML_LOADER)
                 return config.get('members', [])
         except Exception as e:
             logger.error(f"멤버 설정 파일 로드 실패: {e}")
             raise
 
-    async def get_character_info_async(self, character_name: str) -> List[Dict[str, Any]]:
+    async def get_character_info_async(
+        self,
+        character_name: str,
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> Optional[List[Dict[str, Any]]]:
         """
         캐릭터 이름으로 계정 내 캐릭터 목록을 비동기로 조회합니다.
         
+        요청 제한(429) 응답을 받으면 Retry-After 또는 X-RateLimit-Reset 헤더가 가리키는 시각까지
+        (헤더가 없으면 지수 백오프로) 기다린 뒤 최대 RATE_LIMIT_MAX_RETRIES번 재시도합니다.
+        
         Args:
             character_name: 조회할 캐릭터 이름
+            session: 재사용할 HTTP 세션. 지정하지 않으면 요청마다 새 세션을 생성합니다.
             
         Returns:
-            계정 내 캐릭터 정보
+            계정 내 캐릭터 정보. 조회에 실패하면 None
         """
+        if session is None:
+            async with aiohttp.ClientSession() as new_session:
+                return await self.get_character_info_async(character_name, new_session)
+        
         encoded_name = urllib.parse.quote(character_name)
         siblings_url = f'https://developer-lostark.game.onstove.com/characters/{encoded_name}/siblings'
         
-        async with aiohttp.ClientSession() as session:
-            try:
+        try:
+            for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+                await self._wait_for_rate_limit()
                 async with session.get(siblings_url, headers=self.headers) as response:
+                    self._update_rate_limit(response.headers)
                     if response.status == 200:
-                        return await response.json()
-                    else:
-                        error_msg = await response.text()
-                        logger.error(f"API 요청 실패 - 상태 코드: {response.status}, 캐릭터: {character_name}, 오류: {error_msg}")
-                        return []
-            except Exception as e:
-                logger.error(f"API 요청 중 오류 발생 - 캐릭터: {character_name}, 오류: {str(e)}")
-                return []
-
-    def get_character_info(self, character_name: str) -> List[Dict[str, Any]]:
+                        characters = await response.json(loads=JSON_LOADS)
+                        return characters
+                    
+                    error_msg = await response.text()
+                    if response.status == 429 and attempt < RATE_LIMIT_MAX_RETRIES:
+                        # 다른 요청들도 함께 멈추도록 대기 시각을 공유
+                        delay = self._get_retry_delay(response.headers, attempt)
+                        self._rate_limit_reset_at = max(self._rate_limit_reset_at, time.time() + delay)
+                        logger.warning(f"API 요청 제한 초과 - 캐릭터: {character_name}, {delay:.1f}초 후 재시도 ({attempt + 1}/{RATE_LIMIT_MAX_RETRIES})")
+                        continue
+                    
+                    logger.error(f"API 요청 실패 - 상태 코드: {response.status}, 캐릭터: {character_name}, 오류: {error_msg}")
+                    return None
+        except Exception as e:
+            logger.error(f"API 요청 중 오류 발생 - 캐릭터: {character_name}, 오류: {str(e)}")
+        return None
+
+    @staticmethod
+    def _get_retry_delay(headers: Mapping[str, str], attempt: int) -> float:
+        """
+        요청 제한(429) 응답 후 재시도까지 기다릴 시간을 계산합니다.
+        
+        Args:
+            headers: API 응답 헤더
+            attempt: 지금까지 재시도한 횟수 (0부터 시작)
+            
+        Returns:
+            대기 시간 (초)
+        """
+        backoff = min(2.0 ** attempt, RATE_LIMIT_MAX_BACKOFF)
+        try:
+            return max(float(headers['Retry-After']), backoff)
+        except (KeyError, ValueError):
+            pass
+        try:
+            return max(float(headers['X-RateLimit-Reset']) - time.time(), backoff)
+        except (KeyError, ValueError):
+            return backoff
+
+    def _update_rate_limit(self, headers: Mapping[str, str]) -> None:
+        """
+        응답 헤더의 요청 제한 정보를 확인하고, 남은 요청이 적으면 대기 시각을 기록합니다.
+        
+        Args:
+            headers: API 응답 헤더
+        """
+        try:
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset_at = float(headers['X-RateLimit-Reset'])
+        except (KeyError, ValueError):
+            return
+        
+        if remaining <= RATE_LIMIT_REMAINING_THRESHOLD and reset_at > self._rate_limit_reset_at:
+            self._rate_limit_reset_at = reset_at
+            logger.warning(f"API 요청 제한에 근접했습니다 (남은 요청: {remaining}). 제한 초기화까지 요청을 대기합니다.")
+
+    async def _wait_for_rate_limit(self) -> None:
+        """
+        기록된 요청 제한 초기화 시각까지 대기합니다.
+        """
+        delay = self._rate_limit_reset_at - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def get_character_info(self, character_name: str) -> Optional[List[Dict[str, Any]]]:
         """
         캐릭터 이름으로 계정 내 캐릭터 목록을 동기적으로 조회합니다.
         
@@ -102,20 +205,21 @@ class LostarkService:
             character_name: 조회할 캐릭터 이름
             
         Returns:
-            계정 내 캐릭터 정보
+            계정 내 캐릭터 정보. 조회에 실패하면 None
         """
         try:
             siblings_url = f'https://developer-lostark.game.onstove.com/characters/{urllib.parse.quote(character_name)}/siblings'
-            response = requests.get(siblings_url, headers=self.headers)
+            response = self.http_session.get(siblings_url)
             
             if response.status_code == 200:
-                return response.json()
+                characters = JSON_LOADS(response.content)
+                return characters
             else:
                 logger.error(f"API 요청 실패 - 상태 코드: {response.status_code}, 캐릭터: {character_name}, 오류: {response.text}")
-                return []
+                return None
         except Exception as e:
             logger.error(f"API 요청 중 오류 발생 - 캐릭터: {character_name}, 오류: {str(e)}")
-            return []
+            return None
 
     def filter_characters(self, characters: List[Dict[str, Any]], min_level: float = 1600.0) -> List[Dict[str, Any]]:
         """
@@ -146,20 +250,31 @@ class LostarkService:
         
         return filtered_characters
 
-    async def collect_all_members_characters_async(self, min_level: float = 1600.0) -> Dict[str, Any]:
+    async def collect_all_members_characters_async(
+        self,
+        min_level: float = 1600.0,
+        previous_path: str = CHARACTER_INFO_PATH
+    ) -> Dict[str, Any]:
         """
         모든 멤버의 캐릭터 정보를 비동기로 수집합니다.
         
+        캐릭터 조회에 실패한 멤버는 이전에 저장된 정보를 그대로 유지하여,
+        일부 요청이 실패해도 저장 파일에서 멤버가 빠지지 않도록 합니다.
+        
         Args:
             min_level: 최소 아이템 레벨
+            previous_path: 조회 실패 시 유지할 이전 캐릭터 정보 파일 경로
             
         Returns:
             멤버별 캐릭터 정보 (discord_id를 키로 사용)
         """
-        members = self._load_members_config()
+        # 설정 파일 파싱이 이벤트 루프를 막지 않도록 작업 스레드에서 로드
+        members = await asyncio.to_thread(self._load_members_config)
         result = {}
         processed_character_set: Set[str] = set()  # 중복 처리 방지용 세트
         
+        # 멤버별로 조회할 캐릭터 이름을 먼저 정리 (먼저 등록한 멤버가 캐릭터를 가져감)
+        member_requests: List[Tuple[Any, List[str]]] = []
         for member in members:
             # 비활성 멤버 건너뛰기
             if not member.get('active', False):
@@ -172,20 +287,43 @@ class LostarkService:
             if not main_characters:
                 continue
             
-            member_characters = []
-            
-            # 각 메인 캐릭터별로 정보 수집
-            tasks = []
+            character_names = []
             for character_name in main_characters:
                 if character_name not in processed_character_set:  # 이미 처리한 캐릭터는 건너뛰기
                     processed_character_set.add(character_name)
-                    tasks.append(self.get_character_info_async(character_name))
+                    character_names.append(character_name)
             
-            # 비동기 요청 실행
-            results = await asyncio.gather(*tasks)
+            member_requests.append((discord_id, character_names))
+        
+        # 모든 멤버의 요청을 하나의 세션에서 동시에 실행 (동시 요청 수는 제한)
+        semaphore = asyncio.Semaphore(API_REQUEST_CONCURRENCY)
+        
+        async def fetch(session: aiohttp.ClientSession, character_name: str) -> Optional[List[Dict[str, Any]]]:
+            async with semaphore:
+                return await self.get_character_info_async(character_name, session)
+        
+        async with aiohttp.ClientSession() as session:
+            results = await asyncio.gather(*(
+                fetch(session, character_name)
+                for _, character_names in member_requests
+                for character_name in character_names
+            ))
+        
+        # 결과 처리 (요청 순서대로 멤버별로 나누어 처리)
+        previous_data: Optional[Dict[str, Any]] = None
+        result_iter = iter(results)
+        for discord_id, character_names in member_requests:
+            member_results = [next(result_iter) for _ in character_names]
+            
+            # 조회에 실패한 캐릭터가 있으면 일부만 저장하지 않고 이전 정보를 유지
+            if any(characters is None for characters in member_results):
+                if previous_data is None:
+                    previous_data = await asyncio.to_thread(self._load_previous_characters, previous_path)
+                self._keep_previous_characters(result, discord_id, previous_data)
+                continue
             
-            # 결과 처리
-            for characters in results:
+            member_characters = []
+            for characters in member_results:
                 if characters:
                     filtered_characters = self.filter_characters(characters, min_level)
                     member_characters.extend(filtered_characters)
@@ -202,12 +340,53 @@ class LostarkService:
         
         return result
 
-    def collect_all_members_characters(self, min_level: float = 1600.0) -> Dict[str, Any]:
+    @staticmethod
+    def _load_previous_characters(file_path: str) -> Dict[str, Any]:
+        """
+        이전에 저장된 멤버 캐릭터 정보를 로드합니다.
+        
+        Args:
+            file_path: 캐릭터 정보 파일 경로
+            
+        Returns:
+            멤버별 캐릭터 정보. 파일이 없거나 읽을 수 없으면 빈 딕셔너리
+        """
+        try:
+            return load_yaml_config(file_path)
+        except Exception as e:
+            logger.warning(f"이전 캐릭터 정보 로드 실패: {str(e)}")
+            return {}
+
+    @staticmethod
+    def _keep_previous_characters(result: Dict[str, Any], discord_id: Any, previous_data: Dict[str, Any]) -> None:
+        """
+        캐릭터 조회에 실패한 멤버의 이전 정보를 결과에 그대로 옮깁니다.
+        
+        Args:
+            result: 수집 중인 멤버별 캐릭터 정보
+            discord_id: 조회에 실패한 멤버의 discord_id
+            previous_data: 이전에 저장된 멤버별 캐릭터 정보
+        """
+        previous_characters = previous_data.get(discord_id)
+        if previous_characters:
+            result[discord_id] = previous_characters
+            logger.warning(f"캐릭터 조회 실패로 이전 정보를 유지합니다 - 멤버: {discord_id}")
+        else:
+            logger.warning(f"캐릭터 조회 실패, 유지할 이전 정보가 없습니다 - 멤버: {discord_id}")
+
+    def collect_all_members_characters(
+        self,
+        min_level: float = 1600.0,
+        previous_path: str = CHARACTER_INFO_PATH
+    ) -> Dict[str, Any]:
         """
         모든 멤버의 캐릭터 정보를 동기적으로 수집합니다.
         
+        비동기 버전과 마찬가지로 캐릭터 조회에 실패한 멤버는 이전에 저장된 정보를 유지합니다.
+        
         Args:
             min_level: 최소 아이템 레벨
+            previous_path: 조회 실패 시 유지할 이전 캐릭터 정보 파일 경로
             
         Returns:
             멤버별 캐릭터 정보 (discord_id를 키로 사용)
@@ -215,6 +394,7 @@ class LostarkService:
         members = self._load_members_config()
         result = {}
         processed_character_set: Set[str] = set()  # 중복 처리 방지용 세트
+        previous_data: Optional[Dict[str, Any]] = None
         
         for member in members:
             # 비활성 멤버 건너뛰기
@@ -229,16 +409,26 @@ class LostarkService:
                 continue
             
             member_characters = []
+            lookup_failed = False
             
             # 각 메인 캐릭터별로 정보 수집
             for character_name in main_characters:
                 if character_name not in processed_character_set:  # 이미 처리한 캐릭터는 건너뛰기
                     processed_character_set.add(character_name)
                     characters = self.get_character_info(character_name)
-                    if characters:
+                    if characters is None:
+                        lookup_failed = True
+                    elif characters:
                         filtered_characters = self.filter_characters(characters, min_level)
                         member_characters.extend(filtered_characters)
             
+            # 조회에 실패한 캐릭터가 있으면 일부만 저장하지 않고 이전 정보를 유지
+            if lookup_failed:
+                if previous_data is None:
+                    previous_data = self._load_previous_characters(previous_path)
+                self._keep_previous_characters(result, discord_id, previous_data)
+                continue
+            
             if member_characters:
                 # 캐릭터 목록에서 중복 제거 (CharacterName 기준)
                 unique_characters = {}
@@ -251,7 +441,7 @@ class LostarkService:
         
         return result
 
-    def save_members_characters_info(self, data: Dict[str, Any], output_path: str = "data/members_character_info.yaml") -> None:
+    def save_members_characters_info(self, data: Dict[str, Any], output_path: str = CHARACTER_INFO_PATH) -> None:
         """
         수집된 멤버 캐릭터 정보를 YAML 파일로 저장합니다.
         
@@ -263,9 +453,10 @@ class LostarkService:
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as file:
-                yaml.dump(data, file, allow_unicode=True, sort_keys=False)
-            logger.info(f"멤버 캐릭터 정보가 성공적으로 저장되었습니다: {output_path}")
+            if save_yaml_file(output_path, data):
+                logger.info(f"멤버 캐릭터 정보가 성공적으로 저장되었습니다: {output_path}")
+            else:
+                logger.info(f"멤버 캐릭터 정보에 변경 사항이 없어 저장을 건너뜁니다: {output_path}")
         except Exception as e:
             logger.error(f"멤버 캐릭터 정보 저장 실패: {str(e)}")
             raise
@@ -278,7 +469,7 @@ async def collect_and_save_character_info() -> None:
     try:
         service = LostarkService()
         data = await service.collect_all_members_characters_async()
-        service.save_members_characters_info(data)
+        await asyncio.to_thread(service.save_members_characters_info, data)
         logger.info("캐릭터 정보 수집 및 저장 완료")
     except Exception as e:
         logger.error(f"캐릭터 정보 수집 및 저장 중 오류 발생: {str(e)}")
@@ -28,6 +28,14 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 # 상수 정의
 GPT_MODEL = "gpt-4o"  # 사용할 모델
 
+# 숫자+역할 패턴 (예: 2딜, 3폿) - 모듈 로드 시 한 번만 컴파일
+ROLE_COUNT_PATTERNS: Tuple[Tuple["re.Pattern[str]", str], ...] = (
+    (re.compile(r'(\d+)딜'), 'dps'),
+    (re.compile(r'(\d+)딜러'), 'dps'),
+    (re.compile(r'(\d+)폿'), 'sup'),
+    (re.compile(r'(\d+)서포터'), 'sup'),
+)
+
 
 class OpenAIService:
     """
@@ -54,6 +62,43 @@ class OpenAIService:
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.api_key}'
         }
+        
+        # 요청 간에 재사용하는 HTTP 세션 (첫 요청 시 생성)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        재사용할 HTTP 세션을 가져옵니다. 세션이 없거나 닫혔으면 새로 생성합니다.
+        
+        Returns:
+            HTTP 세션
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self) -> None:
+        """
+        재사용 중인 HTTP 세션을 닫습니다.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "OpenAIService":
+        """
+        async with 블록 진입 시 서비스 자신을 돌려줍니다.
+        
+        Returns:
+            OpenAIService 인스턴스
+        """
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        """
+        async with 블록을 벗어날 때 HTTP 세션을 닫습니다.
+        """
+        await self.close()
 
     async def parse_raid_command(self, user_id: str, command_text: str, command_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -71,15 +116,8 @@ class OpenAIService:
             # 이 명령어가 숫자+역할 패턴인지 확인
 
         pattern_count = 0
-        num_role_patterns = [
-            (r'(\d+)딜', 'dps'),
-            (r'(\d+)딜러', 'dps'),
-            (r'(\d+)폿', 'sup'),
-            (r'(\d+)서포터', 'sup')
-        ]
-        
-        for pattern, role_type in num_role_patterns:
-            matches = re.findall(pattern, command_text)
+        for pattern, role_type in ROLE_COUNT_PATTERNS:
+            matches = pattern.findall(command_text)
             for match in matches:
                 try:
                     pattern_count += int(match)
@@ -244,54 +282,54 @@ output: {"commands": [{"user":"random_id_505", "command":"edit", "role":null, "r
             
             logger.info(f"[DEBUG] OpenAI 요청: {payload['messages'][1]['content']}")
             
-            # API 호출
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=self.headers, json=payload) as response:
-                    response_json = await response.json()
+            # API 호출 (연결을 재사용하여 요청마다 TLS 핸드셰이크를 반복하지 않음)
+            session = self._get_session()
+            async with session.post(url, headers=self.headers, json=payload) as response:
+                response_json = await response.json()
+                
+                if response.status != 200:
+                    logger.error(f"OpenAI API 오류: {response_json}")
+                    # logger.info(f"[DEBUG] 백업 파싱 결과 사용: {backup_parsed}")
+                    # return backup_parsed
+                    return []
+                
+                # 응답에서 명령어 데이터 추출
+                content = response_json.get("choices", [{}])[0].get("message", {}).get("content", "{}")
+                logger.info(f"[DEBUG] OpenAI 응답 원본: {content}")
+                
+                # JSON 파싱
+                try:
+                    parsed_data = json.loads(content)
+                    # 응답이 배열 형태가 아니면 배열로 변환
+                    commands = []
+                    if isinstance(parsed_data, dict):
+                        if "commands" in parsed_data:
+                            commands = parsed_data["commands"]
+                            logger.info(f"[DEBUG] 파싱된 명령어(commands 필드): {commands}")
+                        else:
+                            commands = [parsed_data]
+                            logger.info(f"[DEBUG] 파싱된 명령어(단일 객체): {commands}")
+                    else:
+                        commands = parsed_data
+                        logger.info(f"[DEBUG] 파싱된 명령어(배열): {commands}")
                     
-                    if response.status != 200:
-                        logger.error(f"OpenAI API 오류: {response_json}")
-                        # logger.info(f"[DEBUG] 백업 파싱 결과 사용: {backup_parsed}")
-                        # return backup_parsed
-                        return []
+                    # 숫자+역할 패턴인 경우 명령어 수 체크
+                    if pattern_count > 0 and len(commands) < pattern_count:
+                        logger.warning(f"[DEBUG] 숫자+역할 패턴에 대한 명령어 수({len(commands)})가 예상({pattern_count})보다 적음")
+                        # 명령어 복제하여 맞추기
+                        if len(commands) > 0 and pattern_count > 0:
+                            first_cmd = commands[0]
+                            while len(commands) < pattern_count:
+                                commands.append(first_cmd.copy())
+                            logger.info(f"[DEBUG] 명령어 복제 후 개수: {len(commands)}")
                     
-                    # 응답에서 명령어 데이터 추출
-                    content = response_json.get("choices", [{}])[0].get("message", {}).get("content", "{}")
-                    logger.info(f"[DEBUG] OpenAI 응답 원본: {content}")
+                    return commands
+                except json.JSONDecodeError as e:
+                    logger.error(f"JSON 파싱 오류: {str(e)}, 원본 내용: {content}")
+                    # logger.info(f"[DEBUG] 백업 파싱 결과 사용: {backup_parsed}")
+                    # return backup_parsed
+                    return []
                     
-                    # JSON 파싱
-                    try:
-                        parsed_data = json.loads(content)
-                        # 응답이 배열 형태가 아니면 배열로 변환
-                        commands = []
-                        if isinstance(parsed_data, dict):
-                            if "commands" in parsed_data:
-                                commands = parsed_data["commands"]
-                                logger.info(f"[DEBUG] 파싱된 명령어(commands 필드): {commands}")
-                            else:
-                                commands = [parsed_data]
-                                logger.info(f"[DEBUG] 파싱된 명령어(단일 객체): {commands}")
-                        else:
-                            commands = parsed_data
-                            logger.info(f"[DEBUG] 파싱된 명령어(배열): {commands}")
-                        
-                        # 숫자+역할 패턴인 경우 명령어 수 체크
-                        if pattern_count > 0 and len(commands) < pattern_count:
-                            logger.warning(f"[DEBUG] 숫자+역할 패턴에 대한 명령어 수({len(commands)})가 예상({pattern_count})보다 적음")
-                            # 명령어 복제하여 맞추기
-                            if len(commands) > 0 and pattern_count > 0:
-                                first_cmd = commands[0]
-                                while len(commands) < pattern_count:
-                                    commands.append(first_cmd.copy())
-                                logger.info(f"[DEBUG] 명령어 복제 후 개수: {len(commands)}")
-                        
-                        return commands
-                    except json.JSONDecodeError as e:
-                        logger.error(f"JSON 파싱 오류: {str(e)}, 원본 내용: {content}")
-                        # logger.info(f"[DEBUG] 백업 파싱 결과 사용: {backup_parsed}")
-                        # return backup_parsed
-                        return []
-                        
         except Exception as e:
             logger.error(f"OpenAI API 요청 중 오류 발생: {str(e)}")
             # logger.info(f"[DEBUG] 백업 파싱 결과 사용: {backup_parsed}")
@@ -377,16 +415,8 @@ output: {"commands": [{"user":"random_id_505", "command":"edit", "role":null, "r
         roles_count = []
         
         # 정규식으로 숫자+역할 패턴 찾기 (예: 2딜, 3폿)
-        import re
-        patterns = [
-            (r'(\d+)딜', 'dps'),
-            (r'(\d+)딜러', 'dps'),
-            (r'(\d+)폿', 'sup'),
-            (r'(\d+)서포터', 'sup')
-        ]
-        
-        for pattern, role_type in patterns:
-            matches = re.findall(pattern, command_text)
+        for pattern, role_type in ROLE_COUNT_PATTERNS:
+            matches = pattern.findall(command_text)
             for match in matches:
                 try:
                     count = int(match)
@@ -437,20 +467,11 @@ output: {"commands": [{"user":"random_id_505", "command":"edit", "role":null, "r
         Returns:
             예상 명령어 수
         """
-        # 정규식으로 숫자+역할 패턴 찾기
-        import re
         expected_count = 0
         
         # 숫자+역할 패턴 확인 (예: 2딜, 3폿)
-        patterns = [
-            r'(\d+)딜',
-            r'(\d+)딜러',
-            r'(\d+)폿',
-            r'(\d+)서포터'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, command_text)
+        for pattern, _ in ROLE_COUNT_PATTERNS:
+            matches = pattern.findall(command_text)
             for match in matches:
                 try:
                     expected_count += int(match)
@@ -7,6 +7,7 @@ config_utils 모듈 단위 테스트.
 이 모듈은 YAML 설정 파일 로드 및 메시지 포맷팅 기능을 테스트합니다.
 """
 
+import glob
 import os
 import tempfile
 import pytest
@@ -14,7 +15,7 @@ from typing import Dict, List, Any, cast, Generator
 import yaml
 from pytest_mock import MockerFixture
 
-from utils.config_utils import load_yaml_config, format_raid_message, aload_yaml_config
+from utils.config_utils import load_yaml_config, format_raid_message, aload_yaml_config, save_yaml_file
 
 
 @pytest.fixture
@@ -90,6 +91,41 @@ class TestConfigUtils:
         assert config["raids"][1]["min_level"] == 1680
         assert config["raids"][1]["max_level"] is None
     
+    def test_load_yaml_config_reloads_when_file_changes(self, temp_yaml_file: str) -> None:
+        """
+        load_yaml_config 함수가 파일이 변경되지 않으면 캐시를 재사용하고, 변경되면 다시 로드하는지 테스트합니다.
+        
+        Args:
+            temp_yaml_file: 임시 YAML 파일 경로
+        """
+        first = load_yaml_config(temp_yaml_file)
+        assert load_yaml_config(temp_yaml_file) is first
+        
+        # 파일 내용과 수정 시각 변경
+        with open(temp_yaml_file, "w", encoding="utf-8") as file:
+            yaml.dump({"raids": []}, file, allow_unicode=True)
+        stat = os.stat(temp_yaml_file)
+        os.utime(temp_yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        reloaded = load_yaml_config(temp_yaml_file)
+        assert reloaded is not first
+        assert reloaded["raids"] == []
+    
+    def test_load_yaml_config_copy(self, temp_yaml_file: str) -> None:
+        """
+        load_yaml_config 함수가 copy=True일 때 공유 캐시와 분리된 복사본을 반환하는지 테스트합니다.
+        
+        Args:
+            temp_yaml_file: 임시 YAML 파일 경로
+        """
+        shared = load_yaml_config(temp_yaml_file)
+        copied = load_yaml_config(temp_yaml_file, copy=True)
+        assert copied == shared
+        assert copied is not shared
+        
+        copied["raids"].clear()
+        assert load_yaml_config(temp_yaml_file)["raids"]
+    
     def test_load_yaml_config_file_not_found(self) -> None:
         """
         load_yaml_config 함수가 존재하지 않는 파일에 대해 오류를 발생시키는지 테스트합니다.
@@ -97,6 +133,50 @@ class TestConfigUtils:
         with pytest.raises(FileNotFoundError):
             load_yaml_config("non_existent_file.yaml")
     
+    def test_save_yaml_file(self, temp_yaml_file: str, mock_raids_config: Dict[str, List[Dict[str, Any]]]) -> None:
+        """
+        save_yaml_file 함수가 데이터를 저장하고, 내용이 같으면 파일을 다시 쓰지 않는지 테스트합니다.
+        
+        Args:
+            temp_yaml_file: 임시 YAML 파일 경로
+            mock_raids_config: 모의 레이드 설정
+        """
+        new_config = {"raids": mock_raids_config["raids"][:1]}
+        assert save_yaml_file(temp_yaml_file, new_config) is True
+        assert not glob.glob(f"{glob.escape(temp_yaml_file)}.*.tmp")
+        
+        with open(temp_yaml_file, "r", encoding="utf-8") as file:
+            assert yaml.safe_load(file) == new_config
+        
+        # 같은 내용을 다시 저장하면 파일을 건드리지 않음
+        mtime_ns = os.stat(temp_yaml_file).st_mtime_ns
+        assert save_yaml_file(temp_yaml_file, new_config) is False
+        assert os.stat(temp_yaml_file).st_mtime_ns == mtime_ns
+    
+    def test_save_yaml_file_failure_keeps_original(self, temp_yaml_file: str, mocker: MockerFixture) -> None:
+        """
+        save_yaml_file 함수가 직렬화나 파일 교체에 실패해도 기존 파일을 유지하고 임시 파일을 남기지 않는지 테스트합니다.
+        
+        Args:
+            temp_yaml_file: 임시 YAML 파일 경로
+            mocker: pytest-mock fixture
+        """
+        with open(temp_yaml_file, "rb") as file:
+            original = file.read()
+        
+        # 직렬화할 수 없는 데이터
+        with pytest.raises(yaml.YAMLError):
+            save_yaml_file(temp_yaml_file, {"raids": object()})
+        
+        # 임시 파일 기록 후 교체 단계에서 실패
+        mocker.patch("utils.config_utils.os.replace", side_effect=OSError("교체 실패"))
+        with pytest.raises(OSError):
+            save_yaml_file(temp_yaml_file, {"raids": []})
+        
+        with open(temp_yaml_file, "rb") as file:
+            assert file.read() == original
+        assert not glob.glob(f"{glob.escape(temp_yaml_file)}.*.tmp")
+    
     def test_format_raid_message_with_max_level(self) -> None:
         """
         format_raid_message 함수가 최대 레벨이 있는 레이드 정보를 올바르게 포맷팅하는지 테스트합니다.
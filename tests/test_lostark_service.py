@@ -10,12 +10,12 @@
 import json
 import os
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import yaml
 
-from services.lostark_service import LostarkService
+from services.lostark_service import RATE_LIMIT_MAX_RETRIES, LostarkService
 
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
@@ -136,9 +136,47 @@ def lostark_service() -> LostarkService:
             'accept': 'application/json',
             'authorization': f'bearer {service.api_key}'
         }
+        service._rate_limit_reset_at = 0.0
         return service
 
 
+class FakeResponse:
+    """
+    aiohttp 응답을 흉내 내는 테스트용 클래스.
+    """
+    
+    def __init__(self, status: int, data: Any = None, headers: Optional[Dict[str, str]] = None) -> None:
+        self.status = status
+        self.data = data
+        self.headers = headers or {}
+    
+    async def __aenter__(self) -> "FakeResponse":
+        return self
+    
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+    
+    async def json(self, loads: Any = None) -> Any:
+        return self.data
+    
+    async def text(self) -> str:
+        return json.dumps(self.data)
+
+
+class FakeSession:
+    """
+    미리 정한 응답을 순서대로 돌려주는 aiohttp 세션 대체 클래스.
+    """
+    
+    def __init__(self, responses: List[FakeResponse]) -> None:
+        self.responses = list(responses)
+        self.request_count = 0
+    
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> FakeResponse:
+        self.request_count += 1
+        return self.responses.pop(0)
+
+
 class TestLostarkService:
     """
     LostarkService 클래스에 대한 테스트.
@@ -197,17 +235,17 @@ class TestLostarkService:
         assert len(filtered) == 1
         assert filtered[0]['CharacterName'] == 'ValidCharacter'
     
-    @patch('services.lostark_service.yaml.safe_load')
+    @patch('services.lostark_service.yaml.load')
     def test_load_members_config(self, mock_yaml_load: MagicMock, lostark_service: LostarkService, mock_members_config: List[Dict[str, Any]]) -> None:
         """
         _load_members_config 메서드가 설정 파일을 올바르게 로드하는지 테스트합니다.
         
         Args:
-            mock_yaml_load: yaml.safe_load에 대한 mock
+            mock_yaml_load: yaml.load에 대한 mock
             lostark_service: LostarkService 인스턴스
             mock_members_config: 멤버 설정 테스트 데이터
         """
-        # yaml.safe_load가 반환할 값 설정
+        # yaml.load가 반환할 값 설정
         mock_yaml_load.return_value = {'members': mock_members_config}
         
         # open 함수를
@@ -311,4 +349,124 @@ class TestLostarkService:
         # member2의 캐릭터 확인
         assert len(result['member2']) == 1
         assert result['member2'][0]['CharacterName'] == 'Character3'
-        assert float(result['member2'][0]['ItemMaxLevel']) >= 1600.0 
\ No newline at end of file
+        assert float(result['member2'][0]['ItemMaxLevel']) >= 1600.0
+    
+    @pytest.mark.asyncio
+    async def test_get_character_info_async_retries_after_rate_limit(
+        self,
+        lostark_service: LostarkService,
+        mock_character_data: List[Dict[str, Any]]
+    ) -> None:
+        """
+        get_character_info_async 메서드가 429 응답 후 대기했다가 재시도하는지 테스트합니다.
+        
+        Args:
+            lostark_service: LostarkService 인스턴스
+            mock_character_data: 캐릭터 정보 테스트 데이터
+        """
+        session = FakeSession([
+            FakeResponse(429, {'message': 'rate limited'}, {'Retry-After': '3'}),
+            FakeResponse(200, mock_character_data),
+        ])
+        
+        with patch('services.lostark_service.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            result = await lostark_service.get_character_info_async('Character1', session)
+        
+        assert result == mock_character_data
+        assert session.request_count == 2
+        # Retry-After 헤더만큼 기다린 뒤 재시도
+        mock_sleep.assert_awaited_once()
+        assert 2.0 < mock_sleep.await_args.args[0] <= 3.0
+    
+    @pytest.mark.asyncio
+    async def test_get_character_info_async_gives_up_after_max_retries(self, lostark_service: LostarkService) -> None:
+        """
+        get_character_info_async 메서드가 429 응답이 계속되면 재시도 횟수를 넘긴 뒤 None을 반환하는지 테스트합니다.
+        
+        Args:
+            lostark_service: LostarkService 인스턴스
+        """
+        session = FakeSession([FakeResponse(429, {'message': 'rate limited'}) for _ in range(RATE_LIMIT_MAX_RETRIES + 1)])
+        
+        with patch('services.lostark_service.asyncio.sleep', new_callable=AsyncMock):
+            result = await lostark_service.get_character_info_async('Character1', session)
+        
+        assert result is None
+        assert session.request_count == RATE_LIMIT_MAX_RETRIES + 1
+    
+    @pytest.mark.asyncio
+    @patch.object(LostarkService, 'get_character_info_async')
+    @patch.object(LostarkService, '_load_members_config')
+    async def test_collect_all_members_characters_async_keeps_previous_on_failure(
+        self,
+        mock_load_config: MagicMock,
+        mock_get_character_info_async: MagicMock,
+        lostark_service: LostarkService,
+        mock_members_config: List[Dict[str, Any]],
+        mock_character_data: List[Dict[str, Any]],
+        tmp_path: Any
+    ) -> None:
+        """
+        collect_all_members_characters_async 메서드가 조회에 실패한 멤버의 이전 정보를 유지하는지 테스트합니다.
+        
+        Args:
+            mock_load_config: _load_members_config에 대한 mock
+            mock_get_character_info_async: get_character_info_async에 대한 mock
+            lostark_service: LostarkService 인스턴스
+            mock_members_config: 멤버 설정 테스트 데이터
+            mock_character_data: 캐릭터 정보 테스트 데이터
+            tmp_path: 임시 디렉토리
+        """
+        mock_load_config.return_value = mock_members_config
+        
+        # member1의 Character2 조회만 실패
+        async def get_character_info_async_side_effect(character_name: str, session: Any = None) -> Optional[List[Dict[str, Any]]]:
+            if character_name == 'Character2':
+                return None
+            return [mock_character_data[2]]
+        
+        mock_get_character_info_async.side_effect = get_character_info_async_side_effect
+        
+        previous_characters = [{'CharacterName': 'OldCharacter', 'ItemMaxLevel': '1610.0'}]
+        previous_path = tmp_path / 'previous.yaml'
+        previous_path.write_text(yaml.safe_dump({'123456789': previous_characters}), encoding='utf-8')
+        
+        result = await lostark_service.collect_all_members_characters_async(min_level=1600.0, previous_path=str(previous_path))
+        
+        # 실패한 멤버는 이전 정보를 그대로 유지하고, 나머지 멤버는 새로 조회한 정보를 사용
+        assert result['123456789'] == previous_characters
+        assert result['987654321'][0]['CharacterName'] == 'Character3'
+    
+    @patch.object(LostarkService, 'get_character_info')
+    @patch.object(LostarkService, '_load_members_config')
+    def test_collect_all_members_characters_keeps_previous_on_failure(
+        self,
+        mock_load_config: MagicMock,
+        mock_get_character_info: MagicMock,
+        lostark_service: LostarkService,
+        mock_members_config: List[Dict[str, Any]],
+        mock_character_data: List[Dict[str, Any]],
+        tmp_path: Any
+    ) -> None:
+        """
+        collect_all_members_characters 메서드도 조회에 실패한 멤버의 이전 정보를 유지하는지 테스트합니다.
+        
+        Args:
+            mock_load_config: _load_members_config에 대한 mock
+            mock_get_character_info: get_character_info에 대한 mock
+            lostark_service: LostarkService 인스턴스
+            mock_members_config: 멤버 설정 테스트 데이터
+            mock_character_data: 캐릭터 정보 테스트 데이터
+            tmp_path: 임시 디렉토리
+        """
+        mock_load_config.return_value = mock_members_config
+        mock_get_character_info.side_effect = lambda character_name: None if character_name == 'Character2' else [mock_character_data[2]]
+        
+        previous_characters = [{'CharacterName': 'OldCharacter', 'ItemMaxLevel': '1610.0'}]
+        previous_path = tmp_path / 'previous.yaml'
+        previous_path.write_text(yaml.safe_dump({'123456789': previous_characters}), encoding='utf-8')
+        
+        result = lostark_service.collect_all_members_characters(min_level=1600.0, previous_path=str(previous_path))
+        
+        assert result['123456789'] == previous_characters
+        assert result['987654321'][0]['CharacterName'] == 'Character3'
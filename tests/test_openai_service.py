@@ -12,7 +12,8 @@ import os
 import json
 import asyncio
 import pytest
-from typing import Dict, List, Any, Optional, cast
+import pytest_asyncio
+from typing import AsyncIterator, Dict, List, Any, Optional, cast
 from unittest.mock import patch, MagicMock, AsyncMock
 
 from _pytest.logging import LogCaptureFixture
@@ -36,15 +37,16 @@ from services.openai_service import OpenAIService
 pytest_plugins = ['pytest_asyncio']
 
 
-@pytest.fixture
-def openai_service() -> OpenAIService:
+@pytest_asyncio.fixture
+async def openai_service() -> AsyncIterator[OpenAIService]:
     """
-    OpenAI 서비스 인스턴스를 생성하는 fixture.
+    OpenAI 서비스 인스턴스를 생성하고, 테스트가 끝나면 HTTP 세션을 닫는 fixture.
     
-    Returns:
+    Yields:
         OpenAIService 인스턴스
     """
-    return OpenAIService()
+    async with OpenAIService() as service:
+        yield service
 
 
 @pytest.mark.asyncio
@@ -211,9 +213,6 @@ async def test_mock_openai_response(mocker: MockerFixture) -> None:
     # ClientSession 모킹
     mocker.patch('aiohttp.ClientSession', return_value=mock_session)
     
-    # OpenAI 서비스 생성
-    service = OpenAIService(api_key="fake_api_key")
-    
     # 명령어 파싱
     logger.info(f"========== OpenAI API 모킹 테스트 ==========")
     
@@ -223,7 +222,9 @@ async def test_mock_openai_response(mocker: MockerFixture) -> None:
     logger.info(f"입력: user_id={user_id}, command_text={command_text}")
     logger.info(f"모킹된 OpenAI 응답: {json.dumps(fake_response, ensure_ascii=False, indent=2)}")
     
-    commands = await service.parse_raid_command(user_id, command_text)
+    # OpenAI 서비스 생성 (블록을 벗어나면 HTTP 세션을 닫음)
+    async with OpenAIService(api_key="fake_api_key") as service:
+        commands = await service.parse_raid_command(user_id, command_text)
     
     # 결과 로깅
     logger.info(f"파싱 결과: {json.dumps(commands, ensure_ascii=False, indent=2)}")
@@ -245,15 +246,17 @@ if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO, 
                       format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     
-    # OpenAI 서비스 인스턴스 생성
-    service = OpenAIService()
-    
     # 테스트 함수 직접 호출
     async def run_test():
         # 테스트 명령어 리스트 일부만 사용
         test_commands = ["추가 1딜", "추가 1차 딜러"]
         user_id = "test_user_123"
         
+        # OpenAI 서비스 인스턴스 생성 (블록을 벗어나면 HTTP 세션을 닫음)
+        async with OpenAIService() as service:
+            await run_commands(service, test_commands, user_id)
+    
+    async def run_commands(service: OpenAIService, test_commands: List[str], user_id: str) -> None:
         for cmd in test_commands:
             logger.info(f"========== 테스트 명령어: {cmd} ==========")
             logger.info(f"입력: user_id={user_id}, command_text={cmd}")
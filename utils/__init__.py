@@ -10,11 +10,14 @@
 from utils.config_utils import (
     load_yaml_config,
     aload_yaml_config,
+    save_yaml_file,
     format_raid_message
 )
 
 from utils.discord_utils import (
     send_raid_info,
+    delete_threads,
+    purge_channel_messages,
     load_characters_data,
     filter_characters_by_raid_level,
     post_eligible_characters_to_thread,
@@ -25,8 +28,11 @@ from utils.discord_utils import (
 __all__ = [
     'load_yaml_config',
     'aload_yaml_config',
+    'save_yaml_file',
     'format_raid_message',
     'send_raid_info',
+    'delete_threads',
+    'purge_channel_messages',
     'load_characters_data',
     'filter_characters_by_raid_level',
     'post_eligible_characters_to_thread',
@@ -7,34 +7,113 @@
 이 모듈은 YAML 설정 파일 로드 및 메시지 포맷팅을 위한 유틸리티 함수를 제공합니다.
 """
 
+import asyncio
+import functools
 import os
+import tempfile
+from copy import deepcopy
+from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 
 import yaml
 
+# libyaml 기반 C 로더/덤퍼가 있으면 사용하고, 없으면 순수 파이썬 구현으로 대체
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
-def load_yaml_config(file_path: str) -> Dict[str, Any]:
+
+@functools.lru_cache(maxsize=16)
+def _load_yaml_config_cached(file_path: str, mtime_ns: int) -> Dict[str, Any]:
     """
-    YAML 설정 파일을 로드합니다.
+    YAML 설정 파일을 파싱합니다. 파일 경로와 수정 시각을 키로 결과를 캐시합니다.
     
     Args:
         file_path: 설정 파일 경로
+        mtime_ns: 파일 수정 시각 (나노초). 파일이 변경되면 캐시가 무효화됩니다.
         
     Returns:
         설정 정보 딕셔너리
         
+    Raises:
+        yaml.YAMLError: YAML 파싱 오류가 발생한 경우
+    """
+    try:
+        # 파일 객체 대신 단일 바이트 버퍼를 파서에 전달
+        return yaml.load(Path(file_path).read_bytes(), Loader=YAML_LOADER) or {}
+    except yaml.YAMLError as e:
+        raise yaml.YAMLError(f"YAML 파싱 오류: {str(e)}")
+
+
+def load_yaml_config(file_path: str, copy: bool = False) -> Dict[str, Any]:
+    """
+    YAML 설정 파일을 로드합니다.
+    
+    파일이 변경되지 않았다면 이전에 파싱한 결과를 재사용합니다.
+    기본 반환값은 모든 호출자가 공유하는 캐시 객체이므로 수정하면 안 됩니다.
+    결과를 수정해야 하면 copy=True로 깊은 복사본을 받으세요.
+    
+    Args:
+        file_path: 설정 파일 경로
+        copy: True이면 공유 캐시 대신 깊은 복사본을 반환
+        
+    Returns:
+        설정 정보 딕셔너리 (copy=False이면 읽기 전용으로 다뤄야 하는 공유 객체)
+        
     Raises:
         FileNotFoundError: 파일을 찾을 수 없는 경우
         yaml.YAMLError: YAML 파싱 오류가 발생한 경우
     """
-    if not os.path.exists(file_path):
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {file_path}")
     
+    config = _load_yaml_config_cached(file_path, mtime_ns)
+    return deepcopy(config) if copy else config
+
+
+def save_yaml_file(file_path: str, data: Any) -> bool:
+    """
+    데이터를 YAML 파일로 원자적으로 저장합니다.
+    
+    같은 디렉터리의 고유한 임시 파일에 먼저 기록한 뒤 교체하므로 저장 도중 중단되어도
+    기존 파일이 손상되지 않고, 동시에 저장해도 서로의 임시 파일을 덮어쓰지 않습니다.
+    직렬화 결과가 기존 파일 내용과 같으면 파일을 다시 쓰지 않습니다 (수정 시각도 유지됨).
+    
+    Args:
+        file_path: 저장할 파일 경로
+        data: 저장할 데이터
+        
+    Returns:
+        파일을 실제로 기록했으면 True, 내용이 같아 건너뛰었으면 False
+    """
+    content = yaml.dump(data, Dumper=YAML_DUMPER, allow_unicode=True, sort_keys=False).encode('utf-8')
+    
+    path = Path(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file) or {}
-    except yaml.YAMLError as e:
-        raise yaml.YAMLError(f"YAML 파싱 오류: {str(e)}")
+        if path.read_bytes() == content:
+            return False
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    replaced = False
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(content)
+        # mkstemp는 0600으로 만들므로 기존 파일 권한을 유지
+        os.chmod(temp_name, mode)
+        os.replace(temp_name, path)
+        replaced = True
+    finally:
+        # 기록이나 교체에 실패하면 임시 파일을 남기지 않음
+        if not replaced:
+            try:
+                os.unlink(temp_name)
+            except FileNotFoundError:
+                pass
+    return True
 
 
 def format_raid_message(raid: Dict[str, Any]) -> str:
@@ -74,18 +153,22 @@ def format_raid_message(raid: Dict[str, Any]) -> str:
     return message
 
 
-async def aload_yaml_config(file_path: str) -> Dict[str, Any]:
+async def aload_yaml_config(file_path: str, copy: bool = False) -> Dict[str, Any]:
     """
     YAML 설정 파일을 비동기적으로 로드하는 래퍼 함수.
     
+    파일 확인과 파싱은 작업 스레드에서 실행하여 이벤트 루프를 막지 않습니다.
+    load_yaml_config와 마찬가지로 기본 반환값은 공유 캐시 객체이므로 수정하면 안 됩니다.
+    
     Args:
         file_path: 설정 파일 경로
+        copy: True이면 공유 캐시 대신 깊은 복사본을 반환
         
     Returns:
-        설정 정보 딕셔너리
+        설정 정보 딕셔너리 (copy=False이면 읽기 전용으로 다뤄야 하는 공유 객체)
         
     Raises:
         FileNotFoundError: 파일을 찾을 수 없는 경우
         yaml.YAMLError: YAML 파싱 오류가 발생한 경우
     """
-    return load_yaml_config(file_path) 
\ No newline at end of file
+    return await asyncio.to_thread(load_yaml_config, file_path, copy) 
\ No newline at end of file
@@ -7,18 +7,19 @@ Discord 관련 공통 유틸리티 모듈.
 이 모듈은 Discord 메시지 전송 및 스레드 관리 등 공통 유틸리티 함수를 제공합니다.
 """
 
+import asyncio
 import logging
 import os
 import yaml
 import json
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional, Union, cast
 
 import discord
 from discord.channel import TextChannel
 from discord.threads import Thread
 
-from utils.config_utils import format_raid_message
+from utils.config_utils import YAML_DUMPER, YAML_LOADER, format_raid_message, save_yaml_file
 
 # 로깅 설정
 logger = logging.getLogger("discord_utils")
@@ -26,6 +27,23 @@ logger = logging.getLogger("discord_utils")
 # 레이드 데이터 저장 디렉토리
 RAID_DATA_DIR = "data/raids"
 
+# 동시에 진행할 스레드 삭제 요청 수
+THREAD_DELETE_CONCURRENCY = 5
+
+# 동시에 진행할 개별 메시지 삭제 요청 수 (일괄 삭제할 수 없는 오래된 메시지용)
+MESSAGE_DELETE_CONCURRENCY = 3
+
+# 디스코드 일괄 삭제가 허용되는 메시지 최대 경과 기간
+BULK_DELETE_MAX_AGE = timedelta(days=14)
+
+# 레이드 스레드 메시지로 처리하는 레이드 관리 명령어 접두사와 명령어 타입
+RAID_COMMAND_TYPES = {
+    "!추가": "add",
+    "!제거": "remove",
+    "!수정": "edit"
+}
+RAID_COMMAND_PREFIXES = tuple(RAID_COMMAND_TYPES)
+
 
 def init_raid_data_directory() -> None:
     """
@@ -72,7 +90,7 @@ def create_raid_data_file(thread_id: int, raid: Dict[str, Any]) -> str:
     
     # 파일 저장
     with open(file_path, 'w', encoding='utf-8') as file:
-        yaml.dump(raid_data, file, allow_unicode=True, sort_keys=False)
+        yaml.dump(raid_data, file, Dumper=YAML_DUMPER, allow_unicode=True, sort_keys=False)
     
     logger.info(f"레이드 데이터 파일 생성: {file_path}")
     return file_path
@@ -96,7 +114,7 @@ def load_raid_data(thread_id: int) -> Optional[Dict[str, Any]]:
     
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file) or {}
+            return yaml.load(file, Loader=YAML_LOADER) or {}
     except Exception as e:
         logger.error(f"레이드 데이터 파일 로드 실패: {str(e)}")
         return None
@@ -119,9 +137,8 @@ def save_raid_data(thread_id: int, data: Dict[str, Any]) -> bool:
         # 디렉토리 확인
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
-        # 데이터 저장
-        with open(file_path, 'w', encoding='utf-8') as file:
-            yaml.dump(data, file, allow_unicode=True, sort_keys=False)
+        # 데이터 저장 (임시 파일 기록 후 교체)
+        save_yaml_file(file_path, data)
         
         logger.info(f"레이드 데이터 저장 완료: {file_path}")
         return True
@@ -297,6 +314,82 @@ async def send_raid_info(client: discord.Client, channel_id: int, raid: Dict[str
         return None
 
 
+async def delete_threads(threads: List[Thread], concurrency: int = THREAD_DELETE_CONCURRENCY) -> int:
+    """
+    스레드들을 동시에 삭제합니다.
+    
+    동시 요청 수는 concurrency개로 제한하며, 삭제에 실패한 스레드는 로깅 후 건너뜁니다.
+    
+    Args:
+        threads: 삭제할 스레드 목록
+        concurrency: 동시에 진행할 삭제 요청 수
+        
+    Returns:
+        삭제에 성공한 스레드 수
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def delete_thread(thread: Thread) -> bool:
+        async with semaphore:
+            try:
+                await thread.delete()
+                return True
+            except Exception as e:
+                logger.error(f"스레드 삭제 중 오류 발생: {str(e)}", exc_info=True)
+                return False
+    
+    results = await asyncio.gather(*(delete_thread(thread) for thread in threads))
+    return sum(results)
+
+
+async def purge_channel_messages(channel: TextChannel, limit: Optional[int] = 100) -> List[discord.Message]:
+    """
+    채널의 최근 메시지를 삭제합니다.
+    
+    14일 이내의 메시지는 일괄 삭제하고, 그보다 오래된 메시지는 개별 삭제 요청을 동시에 보냅니다.
+    
+    Args:
+        channel: 메시지를 삭제할 채널
+        limit: 삭제할 최근 메시지 개수 (None이면 전체)
+        
+    Returns:
+        삭제된 메시지 목록
+    """
+    cutoff = datetime.now(timezone.utc) - BULK_DELETE_MAX_AGE
+    
+    # 14일 이내 메시지는 일괄 삭제 (after 지정 시 기본값이 오래된 순이므로 최신순으로 명시)
+    deleted = await channel.purge(limit=limit, after=cutoff, oldest_first=False, bulk=True)
+    
+    remaining = None if limit is None else limit - len(deleted)
+    if remaining is not None and remaining <= 0:
+        return deleted
+    
+    # 일괄 삭제할 수 없는 오래된 메시지는 개별 삭제
+    old_messages = [
+        message async for message in channel.history(limit=remaining, before=cutoff)
+        if message.type.is_deletable()
+    ]
+    if not old_messages:
+        return deleted
+    
+    semaphore = asyncio.Semaphore(MESSAGE_DELETE_CONCURRENCY)
+    
+    async def delete_message(message: discord.Message) -> bool:
+        async with semaphore:
+            try:
+                await message.delete()
+                return True
+            except discord.NotFound:
+                return False
+            except discord.HTTPException as e:
+                logger.error(f"메시지 삭제 중 오류 발생: {str(e)}")
+                return False
+    
+    results = await asyncio.gather(*(delete_message(message) for message in old_messages))
+    deleted.extend(message for message, success in zip(old_messages, results) if success)
+    return deleted
+
+
 def load_characters_data(file_path: str = "data/members_character_info.yaml") -> Dict[str, List[Dict[str, Any]]]:
     """
     멤버 캐릭터 정보 파일을 로드합니다.
@@ -313,7 +406,7 @@ def load_characters_data(file_path: str = "data/members_character_info.yaml") ->
             return {}
         
         with open(file_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file) or {}
+            return yaml.load(file, Loader=YAML_LOADER) or {}
     except Exception as e:
         logger.error(f"캐릭터 정보 파일 로드 실패: {str(e)}")
         return {}
@@ -570,7 +663,7 @@ def init_raid_schedule_file() -> None:
             "updated_at": datetime.now().isoformat()
         }
         with open(RAID_SCHEDULE_FILE, 'w', encoding='utf-8') as file:
-            yaml.dump(empty_schedule, file, allow_unicode=True, sort_keys=False)
+            yaml.dump(empty_schedule, file, Dumper=YAML_DUMPER, allow_unicode=True, sort_keys=False)
         logger.info(f"레이드 스케줄 파일 초기화: {RAID_SCHEDULE_FILE}")
 
 
@@ -585,7 +678,7 @@ def load_raid_schedule() -> Dict[str, Any]:
     
     try:
         with open(RAID_SCHEDULE_FILE, 'r', encoding='utf-8') as file:
-            schedule_data = yaml.safe_load(file)
+            schedule_data = yaml.load(file, Loader=YAML_LOADER)
             return schedule_data if schedule_data else {"threads": {}, "updated_at": datetime.now().isoformat()}
     except Exception as e:
         logger.error(f"레이드 스케줄 로드 실패: {str(e)}")
@@ -606,8 +699,8 @@ def save_raid_schedule(schedule_data: Dict[str, Any]) -> bool:
         # 업데이트 시간 추가
         schedule_data["updated_at"] = datetime.now().isoformat()
         
-        with open(RAID_SCHEDULE_FILE, 'w', encoding='utf-8') as file:
-            yaml.dump(schedule_data, file, allow_unicode=True, sort_keys=False)
+        # 임시 파일 기록 후 교체
+        save_yaml_file(RAID_SCHEDULE_FILE, schedule_data)
             
         logger.info(f"레이드 스케줄 저장 완료: {RAID_SCHEDULE_FILE}")
         return True